@@ -63,7 +63,9 @@ async def send_message(
             logger.info(f"Updated user {request.user_id[:8]} language to: {detected_language}")
 
         # Generate response
-        response = await ai_service.generate_response(request.user_id, request.message)
+        response = await ai_service.generate_response(
+            request.user_id, request.message, detected_language
+        )
 
         return ChatResponse(
             user_id=request.user_id,
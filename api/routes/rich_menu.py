@@ -146,7 +146,8 @@ async def list_rich_menus(service = Depends(get_rich_menu_service)):
         List of rich menu objects
     """
     try:
-        menus = await service.get_rich_menu_list()
+        # Menus may be changed by the update scripts or the LINE console
+        menus = await service.get_rich_menu_list(use_cache=False)
 
         return {
             "status": "success",
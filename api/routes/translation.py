@@ -9,6 +9,18 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/translate", tags=["Translation"])
 
+# Static payload for GET /languages, built once instead of per request
+SUPPORTED_LANGUAGES_RESPONSE = {
+    "languages": {
+        "id": "Indonesian (Bahasa Indonesia)",
+        "zh": "Traditional Chinese (繁體中文)",
+        "en": "English",
+        "vi": "Vietnamese (Tiếng Việt)",
+        "th": "Thai (ภาษาไทย)",
+        "fil": "Tagalog (Filipino)",
+    }
+}
+
 
 class TranslationRequest(BaseModel):
     text: str
@@ -69,13 +81,4 @@ async def get_supported_languages():
     Returns:
         Dictionary of language codes and their names
     """
-    return {
-        "languages": {
-            "id": "Indonesian (Bahasa Indonesia)",
-            "zh": "Traditional Chinese (繁體中文)",
-            "en": "English",
-            "vi": "Vietnamese (Tiếng Việt)",
-            "th": "Thai (ภาษาไทย)",
-            "fil": "Tagalog (Filipino)",
-        }
-    }
+    return SUPPORTED_LANGUAGES_RESPONSE
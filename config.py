@@ -125,6 +125,13 @@ Các loại hỗ trợ:
     },
 }
 
+# (language, key) -> message, so a lookup is a single dict probe
+_FLAT_MESSAGES = {
+    (lang, key): msg
+    for lang, messages in MESSAGES.items()
+    for key, msg in messages.items()
+}
+
 # Supported languages
 SUPPORTED_LANGUAGES = {
     "id": "Bahasa Indonesia",
@@ -197,6 +204,13 @@ class BotConfig:
             "MODEL_NAME", "aisingapore/Qwen-SEA-LION-v4-32B-IT-4BIT"
         )
 
+        # Request micro-batching for self-hosted vLLM/sglang (opt-in, 0 disables)
+        self.llm_batch_window_ms = self._get_int_env("LLM_BATCH_WINDOW_MS", 0)
+        self.llm_max_batch = self._get_int_env("LLM_MAX_BATCH", 8, minimum=1)
+
+        # Seconds to reuse answers to identical opening questions (0 disables)
+        self.response_cache_ttl = self._get_int_env("RESPONSE_CACHE_TTL", 600)
+
         # Database
         self.db_url = self._get_env_with_default(
             "DATABASE_URL", "sqlite+aiosqlite:///database.db"
@@ -212,6 +226,21 @@ class BotConfig:
         """Get environment variable with default value"""
         return os.getenv(key, default).strip()
 
+    def _get_int_env(self, key: str, default: int, minimum: int = 0) -> int:
+        """Get an integer environment variable no smaller than ``minimum``"""
+        raw = self._get_env_with_default(key, str(default))
+        try:
+            value = int(raw)
+        except ValueError:
+            raise ConfigurationError(
+                f"Invalid {key}: {raw!r}. Must be an integer."
+            ) from None
+        if value < minimum:
+            raise ConfigurationError(
+                f"Invalid {key}: {value}. Must be at least {minimum}."
+            )
+        return value
+
     def _parse_cors_origins(self) -> List[str]:
         """Parse CORS origins from environment"""
         cors_origins = os.getenv("CORS_ORIGINS", "")
@@ -252,8 +281,11 @@ class BotConfig:
     def get_message(self, key: str, language: str = None) -> str:
         """Get a message in the specified language (or bot's default language)"""
         lang = language or self.language
-        lang_messages = MESSAGES.get(lang, MESSAGES["en"])
-        return lang_messages.get(key, key)
+        msg = _FLAT_MESSAGES.get((lang, key))
+        if msg is None:
+            # Unknown languages fall back to English; unknown keys echo the key
+            msg = _FLAT_MESSAGES.get((lang if lang in MESSAGES else "en", key), key)
+        return msg
 
     def get_emergency_info(self) -> str:
         """Get formatted emergency contact information"""
@@ -1,13 +1,19 @@
 from __future__ import annotations
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from cache import TTLCache
 from database.models import Base, Conversation, UserPreferences, GroupSettings
 
 log = logging.getLogger(__name__)
 
+# Language only changes via /lang, so a short-lived cache is safe per process
+LANGUAGE_CACHE_TTL = 300
+# Group settings are read on every group message but rarely change
+GROUP_SETTINGS_CACHE_TTL = 60
+
 
 class DatabaseService:
     """Async SQLAlchemy ORM wrapper."""
@@ -20,6 +26,15 @@ class DatabaseService:
         self.Session: async_sessionmaker[AsyncSession] = async_sessionmaker(
             self.engine, expire_on_commit=False
         )
+        self._language_cache: TTLCache[str, str] = TTLCache(
+            maxsize=10_000, ttl=LANGUAGE_CACHE_TTL
+        )
+        # Bumped on every language write so a read that raced it is not cached
+        self._language_generation = 0
+        # An empty dict records "no settings" so unconfigured groups are cached too
+        self._group_settings_cache: TTLCache[str, dict] = TTLCache(
+            maxsize=10_000, ttl=GROUP_SETTINGS_CACHE_TTL
+        )
         log.info(f"Database initialized with URL: {db_url}")
 
     async def init_db(self) -> None:
@@ -35,6 +50,24 @@ class DatabaseService:
             s.add(Conversation(user_id=user_id, role=role, content=content))
         log.debug("Saved %s for user %s", role, user_id[:8])
 
+    async def save_messages(
+        self, user_id: str, messages: list[tuple[str, str]]
+    ) -> None:
+        """Save several (role, content) turns in one transaction"""
+        # One microsecond apart so history ordering matches the batch order
+        now = datetime.now(timezone.utc)
+        async with self.Session() as s, s.begin():
+            s.add_all(
+                Conversation(
+                    user_id=user_id,
+                    role=role,
+                    content=content,
+                    created_at=now + timedelta(microseconds=i),
+                )
+                for i, (role, content) in enumerate(messages)
+            )
+        log.debug("Saved %d messages for user %s", len(messages), user_id[:8])
+
     async def get_conversation_history(
         self, user_id: str, limit: int = 10
     ) -> list[dict]:
@@ -82,15 +115,24 @@ class DatabaseService:
                 pref.updated_at = datetime.now()
             else:
                 s.add(UserPreferences(user_id=user_id, language=language))
+        self._language_generation += 1
+        self._language_cache.set(user_id, language)
         log.info("Set language=%s for user %s", language, user_id[:8])
 
     async def get_user_language(self, user_id: str) -> Optional[str]:
+        lang = self._language_cache.get(user_id)
+        if lang is not None:
+            return lang
+        generation = self._language_generation
         async with self.Session() as s:
-            lang: Optional[str] = await s.scalar(
+            lang = await s.scalar(
                 select(UserPreferences.language).where(
                     UserPreferences.user_id == user_id
                 )
             )
+        # Unknown users are not cached so onboarding is never served stale
+        if lang is not None and generation == self._language_generation:
+            self._language_cache.set(user_id, lang)
         return lang
 
     async def get_all_user_preferences(self) -> list[dict]:
@@ -129,6 +171,7 @@ class DatabaseService:
                         enabled_by=enabled_by,
                     )
                 )
+        self._group_settings_cache.pop(group_id)
         log.info(
             "Enabled translation for group %s to %s", group_id[:8], target_language
         )
@@ -142,18 +185,25 @@ class DatabaseService:
             if settings:
                 settings.translate_enabled = False
                 settings.updated_at = datetime.now()
+        self._group_settings_cache.pop(group_id)
         log.info("Disabled translation for group %s", group_id[:8])
 
     async def get_group_settings(self, group_id: str) -> Optional[dict]:
         """Get translation settings for a group"""
-        async with self.Session() as s:
-            settings = await s.scalar(
-                select(GroupSettings).where(GroupSettings.group_id == group_id)
-            )
-            if settings:
-                return {
-                    "translate_enabled": settings.translate_enabled,
-                    "target_language": settings.target_language,
-                    "enabled_by": settings.enabled_by,
-                }
-        return None
+        cached = self._group_settings_cache.get(group_id)
+        if cached is None:
+            async with self.Session() as s:
+                settings = await s.scalar(
+                    select(GroupSettings).where(GroupSettings.group_id == group_id)
+                )
+                cached = (
+                    {
+                        "translate_enabled": settings.translate_enabled,
+                        "target_language": settings.target_language,
+                        "enabled_by": settings.enabled_by,
+                    }
+                    if settings
+                    else {}
+                )
+            self._group_settings_cache.set(group_id, cached)
+        return dict(cached) if cached else None
@@ -4,6 +4,7 @@ Dependency injection for FastAPI endpoints and webhook handlers.
 This module provides clean dependency injection without a container pattern.
 Services are lazily initialized and cached for the application lifetime.
 """
+import asyncio
 import logging
 from typing import Optional
 from functools import lru_cache
@@ -59,7 +60,8 @@ async def get_translation_service() -> TranslationService:
     global _translation_service
     if _translation_service is None:
         config = get_config()
-        _translation_service = TranslationService(config)
+        ai_service = await get_ai_service()
+        _translation_service = TranslationService(config, client=ai_service.client)
         logger.info("Translation service initialized")
     return _translation_service
 
@@ -119,20 +121,8 @@ def get_line_parser() -> WebhookParser:
     return _line_parser
 
 
-async def initialize_services():
-    """Initialize all services on application startup"""
-    logger.info("Initializing all services...")
-
-    # Initialize services in order
-    await get_database_service()
-    await get_ai_service()
-    await get_translation_service()
-    await get_language_detection_service()
-    await get_line_messaging_api()
-    rich_menu_service = await get_rich_menu_service()
-    get_line_parser()
-
-    # Set up language-specific rich menus
+async def _setup_rich_menus(rich_menu_service: RichMenuService) -> None:
+    """Create and upload the language-specific rich menus"""
     try:
         logger.info("Setting up language-specific rich menus...")
         language_menus = await rich_menu_service.create_language_rich_menus()
@@ -147,6 +137,25 @@ async def initialize_services():
     except Exception as e:
         logger.error(f"Failed to set up rich menus: {e}", exc_info=True)
 
+
+async def initialize_services():
+    """Initialize all services on application startup"""
+    logger.info("Initializing all services...")
+
+    # LINE clients are constructed synchronously; the rich menu upload only
+    # needs them, so it can run alongside database initialization
+    rich_menu_service = await get_rich_menu_service()
+    get_line_parser()
+
+    await asyncio.gather(
+        get_database_service(),
+        _setup_rich_menus(rich_menu_service),
+    )
+
+    await get_ai_service()
+    await get_translation_service()
+    await get_language_detection_service()
+
     logger.info("All services initialized successfully")
 
 
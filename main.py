@@ -1,6 +1,8 @@
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from functools import cache, lru_cache
+from types import MappingProxyType
 from typing import Any, Optional
 
 from fastapi import FastAPI, HTTPException, Request
@@ -25,7 +27,7 @@ from linebot.v3.webhooks import (
 )
 
 from api.routes import chat, rich_menu, system, translation
-from config import get_config, load_config
+from config import SUPPORTED_LANGUAGES, get_config, load_config
 from database.database import DatabaseService
 from dependencies import (
     cleanup_services,
@@ -46,11 +48,37 @@ from services.flex_messages import (
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger(__name__)
 
+# Language names users type instead of /lang <code> - usability enhancement
+LANGUAGE_ALIASES = MappingProxyType({
+    "bahasa indonesia": "id",
+    "indonesia": "id",
+    "indonesian": "id",
+    "中文": "zh",
+    "繁體中文": "zh",
+    "chinese": "zh",
+    "english": "en",
+    "tiếng việt": "vi",
+    "vietnamese": "vi",
+    "vietnam": "vi",
+})
+
+MAX_ALIAS_LENGTH = max(map(len, LANGUAGE_ALIASES))
+
+# Opening questions sent to the LLM when a rich menu category is tapped
+CATEGORY_PROMPTS = MappingProxyType({
+    "category_labor": "I have some questions I want to ask about work.",
+    "category_daily": "I have some questions I want to ask about daily life.",
+    "category_translate": "I need help translating something.",
+    "category_healthcare": "I have some questions I want to ask about healthcare.",
+    "category_government": "I have some questions I want to ask about government services.",
+})
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     cfg = load_config()
     await initialize_services()
+    warm_flex_containers()
     log.info(f"{cfg.name} started with default language: {cfg.language}")
     try:
         yield
@@ -107,7 +135,9 @@ async def get_user_language(user_id: str, db_service: DatabaseService) -> Option
     return current_lang
 
 
+@cache
 def create_language_quick_reply() -> QuickReply:
+    # Static content, so the model is built once and shared by every reply
     return QuickReply(
         items=[
             QuickReplyItem(action=MessageAction(label="🇮🇩 Bahasa Indonesia", text="/lang id")),
@@ -118,11 +148,36 @@ def create_language_quick_reply() -> QuickReply:
     )
 
 
-async def send_flex_message(line_api: AsyncMessagingApi, reply_token: str, flex_content: dict, alt_text: str) -> None:
+# Parsing a flex dict into SDK models dominates the send path, so the parsed
+# containers for the static templates are built once and reused
+@cache
+def new_user_welcome_flex_container() -> FlexContainer:
+    return FlexContainer.from_dict(create_new_user_welcome_flex())
+
+
+@lru_cache(maxsize=8)
+def help_flex_container(language: str) -> FlexContainer:
+    return FlexContainer.from_dict(create_help_flex_message(language))
+
+
+@lru_cache(maxsize=8)
+def emergency_flex_container(language: str) -> FlexContainer:
+    return FlexContainer.from_dict(create_emergency_flex_message(language))
+
+
+def warm_flex_containers() -> None:
+    """Parse every static flex template up front so no user pays for it"""
+    new_user_welcome_flex_container()
+    for lang in SUPPORTED_LANGUAGES:
+        help_flex_container(lang)
+        emergency_flex_container(lang)
+
+
+async def send_flex_message(line_api: AsyncMessagingApi, reply_token: str, flex_content: FlexContainer, alt_text: str) -> None:
     await line_api.reply_message(
         ReplyMessageRequest(
             reply_token=reply_token,
-            messages=[FlexMessage(alt_text=alt_text, contents=FlexContainer.from_dict(flex_content))],
+            messages=[FlexMessage(alt_text=alt_text, contents=flex_content)],
         )
     )
 
@@ -150,6 +205,37 @@ async def set_user_language(user_id: str, lang_code: str, db_service: DatabaseSe
     return is_new_user, message
 
 
+async def reply_help(line_api: AsyncMessagingApi, reply_token: str, user_id: str, user_lang: str) -> None:
+    help_text = get_config().get_message("help", user_lang)
+    await line_api.reply_message(
+        ReplyMessageRequest(
+            reply_token=reply_token,
+            messages=[
+                TextMessage(text=help_text),
+                FlexMessage(alt_text="IMIGO Help Menu", contents=help_flex_container(user_lang))
+            ]
+        )
+    )
+
+
+async def reply_emergency(line_api: AsyncMessagingApi, reply_token: str, user_id: str, user_lang: str) -> None:
+    await send_flex_message(line_api, reply_token, emergency_flex_container(user_lang), "Emergency Contacts - Taiwan")
+
+
+async def reply_clear(line_api: AsyncMessagingApi, reply_token: str, user_id: str, user_lang: str) -> None:
+    db_service = await get_database_service()
+    await db_service.clear_user_conversation(user_id)
+    await send_text_message(line_api, reply_token, get_config().get_message("cleared", user_lang))
+
+
+# Slash commands available once the user has picked a language
+USER_COMMANDS = MappingProxyType({
+    "/help": reply_help,
+    "/emergency": reply_emergency,
+    "/clear": reply_clear,
+})
+
+
 async def handle_text_message(event: MessageEvent, user_id: str, text: str) -> None:
     cfg = get_config()
     line_api = await get_line_messaging_api()
@@ -166,30 +252,23 @@ async def handle_text_message(event: MessageEvent, user_id: str, text: str) -> N
     except Exception as e:
         log.warning(f"Failed to mark message as read: {e}")
 
-    cmd = text.strip().lower()
+    # Only slash commands and bare language names are matched case-insensitively;
+    # longer chat text can be neither, so it skips the lowercasing pass
+    cmd = text.strip()
+    if cmd[:1] == "/" or len(cmd) <= MAX_ALIAS_LENGTH:
+        cmd = cmd.lower()
 
     # Check if text is a language name - usability enhancement
-    lang_map = {
-        "bahasa indonesia": "id",
-        "indonesia": "id",
-        "indonesian": "id",
-        "中文": "zh",
-        "繁體中文": "zh",
-        "chinese": "zh",
-        "english": "en",
-        "tiếng việt": "vi",
-        "vietnamese": "vi",
-        "vietnam": "vi"
-    }
-    if cmd in lang_map:
-        text = f"/lang {lang_map[cmd]}"
-        cmd = text.strip().lower()
+    if cmd in LANGUAGE_ALIASES:
+        cmd = f"/lang {LANGUAGE_ALIASES[cmd]}"
 
     # Handle language selection first (works for both new and existing users)
     if cmd.startswith("/lang"):
-        parts = text.strip().split()
-        if len(parts) == 2 and cfg.is_valid_language(parts[1].lower()):
-            _, message = await set_user_language(user_id, parts[1].lower(), db_service, rich_menu_service)
+        # Any whitespace separates the code, including the full-width space CJK IMEs type
+        parts = cmd.split(maxsplit=1)
+        lang_code = parts[1] if len(parts) > 1 else ""
+        if cfg.is_valid_language(lang_code):
+            _, message = await set_user_language(user_id, lang_code, db_service, rich_menu_service)
             await send_text_message(line_api, event.reply_token, message)
             return
         # Show language selection prompt
@@ -200,31 +279,15 @@ async def handle_text_message(event: MessageEvent, user_id: str, text: str) -> N
     user_lang = await get_user_language(user_id, db_service)
 
     if user_lang is None:
-        await send_flex_message(line_api, event.reply_token, create_new_user_welcome_flex(), "Welcome to IMIGO! Please select your language.")
-        return
-
-    if cmd == "/help":
-        help_text = cfg.get_message("help", user_lang)
-        flex_msg = create_help_flex_message(user_lang)
-        await line_api.reply_message(
-            ReplyMessageRequest(
-                reply_token=event.reply_token,
-                messages=[
-                    TextMessage(text=help_text),
-                    FlexMessage(alt_text="IMIGO Help Menu", contents=FlexContainer.from_dict(flex_msg))
-                ]
-            )
-        )
+        await send_flex_message(line_api, event.reply_token, new_user_welcome_flex_container(), "Welcome to IMIGO! Please select your language.")
         return
 
-    if cmd == "/emergency":
-        await send_flex_message(line_api, event.reply_token, create_emergency_flex_message(user_lang), "Emergency Contacts - Taiwan")
-        return
-
-    if cmd == "/clear":
-        await db_service.clear_user_conversation(user_id)
-        await send_text_message(line_api, event.reply_token, cfg.get_message("cleared", user_lang))
-        return
+    # Ordinary chat text skips the command table on its first character
+    if cmd[:1] == "/":
+        command = USER_COMMANDS.get(cmd)
+        if command is not None:
+            await command(line_api, event.reply_token, user_id, user_lang)
+            return
 
     group_id = getattr(event.source, "group_id", None)
     if group_id:
@@ -238,7 +301,7 @@ async def handle_text_message(event: MessageEvent, user_id: str, text: str) -> N
             return
 
     try:
-        reply = await ai_service.generate_response(user_id, text)
+        reply = await ai_service.generate_response(user_id, text, user_lang)
     except Exception as e:
         log.error(f"AI service error: {e}", exc_info=True)
         reply = cfg.get_message("help", user_lang)
@@ -261,27 +324,16 @@ async def handle_postback(event: PostbackEvent) -> None:
     user_lang = await db_service.get_user_language(user_id) or cfg.language
 
     if data == "clear_chat":
-        await db_service.clear_user_conversation(user_id)
-        await send_text_message(line_api, event.reply_token, cfg.get_message("cleared", user_lang))
+        await reply_clear(line_api, event.reply_token, user_id, user_lang)
 
     elif data == "category_emergency":
-        await send_flex_message(line_api, event.reply_token, create_emergency_flex_message(user_lang), "Emergency Contacts - Taiwan")
+        await reply_emergency(line_api, event.reply_token, user_id, user_lang)
 
     elif data == "category_language":
         await send_text_message(line_api, event.reply_token, cfg.get_message("language_select", user_lang), create_language_quick_reply())
 
     elif data == "category_help":
-        help_text = cfg.get_message("help", user_lang)
-        flex_msg = create_help_flex_message(user_lang)
-        await line_api.reply_message(
-            ReplyMessageRequest(
-                reply_token=event.reply_token,
-                messages=[
-                    TextMessage(text=help_text),
-                    FlexMessage(alt_text="IMIGO Help Menu", contents=FlexContainer.from_dict(flex_msg))
-                ]
-            )
-        )
+        await reply_help(line_api, event.reply_token, user_id, user_lang)
 
     elif data.startswith("lang_"):
         lang_code = data.split("_")[1]
@@ -290,23 +342,14 @@ async def handle_postback(event: PostbackEvent) -> None:
             await send_text_message(line_api, event.reply_token, message)
 
     else:
-        prompts = {
-            "category_labor": "I have some questions I want to ask about work.",
-            "category_daily": "I have some questions I want to ask about daily life.",
-            "category_translate": "I need help translating something.",
-            "category_healthcare": "I have some questions I want to ask about healthcare.",
-            "category_government": "I have some questions I want to ask about government services.",
-        }
-
         # Get full language name for clearer instruction to LLM
-        from config import SUPPORTED_LANGUAGES
         user_lang_name = SUPPORTED_LANGUAGES.get(user_lang, "English")
-        
-        base_prompt = prompts.get(data, cfg.get_message("help", user_lang))
+
+        base_prompt = CATEGORY_PROMPTS.get(data) or cfg.get_message("help", user_lang)
         full_prompt = f"{base_prompt} (IMPORTANT: Please respond in {user_lang_name}.)"
 
         try:
-            reply = await ai_service.generate_response(user_id, full_prompt)
+            reply = await ai_service.generate_response(user_id, full_prompt, user_lang)
         except Exception as e:
             log.error(f"AI service error in postback: {e}", exc_info=True)
             reply = cfg.get_message("help", user_lang)
@@ -333,7 +376,7 @@ async def handle_follow(event: FollowEvent) -> None:
         await rich_menu_service.set_user_rich_menu(user_id, existing_lang)
     else:
         # Brand new user - send multi-language welcome flex message
-        await send_flex_message(line_api, event.reply_token, create_new_user_welcome_flex(), "Welcome to IMIGO! Please select your language.")
+        await send_flex_message(line_api, event.reply_token, new_user_welcome_flex_container(), "Welcome to IMIGO! Please select your language.")
 
 
 async def handle_message(event: MessageEvent) -> None:
@@ -378,6 +421,10 @@ async def webhook(request: Request) -> dict[str, str]:
 
 
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop (from uvicorn[standard]) is unavailable on Windows
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop=loop)
@@ -1,24 +1,68 @@
 """AI service for generating responses using LLM"""
+import hashlib
 import logging
 import os
 import re
+from typing import Optional
 
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
+from cache import TTLCache
 from config import BotConfig
 from database.database import DatabaseService
 from exceptions import AIServiceError, ConfigurationError
+from services.llm_batcher import LLMBatcher
 
 logger = logging.getLogger(__name__)
 
 
+# Compiled once; these run on every LLM reply
+_BOLD_STAR_RE = re.compile(r"\*\*(.*?)\*\*")
+_BOLD_UNDERSCORE_RE = re.compile(r"__(.*?)__")
+_ITALIC_STAR_RE = re.compile(r"(?<!\*)\*(.*?)\*(?!\*)")
+_ITALIC_UNDERSCORE_RE = re.compile(r"(?<!_)_(.*?)_(?!_)")
+_THINK_BLOCK_RE = re.compile(r"^[\s\S]*?<\/think>\s*")
+
+
 def strip_markdown_formatting(text: str) -> str:
-    text = re.sub(r"\*\*(.*?)\*\*", r"\1", text)
-    text = re.sub(r"__(.*?)__", r"\1", text)
-    text = re.sub(r"(?<!\*)\*(.*?)\*(?!\*)", r"\1", text)
-    text = re.sub(r"(?<!_)_(.*?)_(?!_)", r"\1", text)
+    text = _BOLD_STAR_RE.sub(r"\1", text)
+    text = _BOLD_UNDERSCORE_RE.sub(r"\1", text)
+    text = _ITALIC_STAR_RE.sub(r"\1", text)
+    text = _ITALIC_UNDERSCORE_RE.sub(r"\1", text)
     return text
 
+
+def _truncate(text: str, limit: int) -> str:
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+# Connection pool sized for bursts of concurrent webhook traffic
+HTTP_LIMITS = httpx.Limits(max_connections=256, max_keepalive_connections=128)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# Token budget for replayed conversation history in each prompt
+HISTORY_TOKEN_BUDGET = 1500
+
+
+def _estimate_tokens(text: str) -> int:
+    # CJK characters are roughly one token each; other scripts average ~4 chars/token
+    wide = sum(1 for ch in text if ch >= "\u2e80")
+    return wide + (len(text) - wide) // 4 + 1
+
+
+def _trim_history(history: list[dict], budget: int) -> list[dict]:
+    """Keep the newest turns whose combined size fits within ``budget`` tokens"""
+    kept = []
+    for msg in reversed(history):
+        budget -= _estimate_tokens(msg["content"])
+        if budget < 0:
+            break
+        kept.append(msg)
+    kept.reverse()
+    return kept
+
+
 class AIService:
     LANGUAGES = {
         "en": "English",
@@ -34,6 +78,25 @@ class AIService:
         self.config = config
         self.model_name = config.model_name
         self.client = self._init_client()
+        # Sampling settings are fixed, so every request reuses the same kwargs
+        self._completion_params = {
+            "model": self.model_name,
+            "temperature": 0.7,
+            "max_tokens": 1000,
+        }
+        self._chat_create = self.client.chat.completions.create
+        self._batcher = self._init_batcher()
+        # The system prompt only varies by language, so build each one up front
+        self._system_messages = {
+            code: {"role": "system", "content": self._get_system_prompt(code)}
+            for code in self.LANGUAGES
+        }
+        # Opening questions (hotlines, category prompts) recur across users
+        self._response_cache: Optional[TTLCache[bytes, str]] = (
+            TTLCache(maxsize=1024, ttl=config.response_cache_ttl)
+            if config.response_cache_ttl > 0
+            else None
+        )
 
     def _init_client(self) -> AsyncOpenAI:
         try:
@@ -43,13 +106,29 @@ class AIService:
             if not base_url:
                 if api_key == "dummy-key":
                     raise ConfigurationError("LLM_API_KEY required when using OpenAI")
-                return AsyncOpenAI(api_key=api_key)
+                base_url = None
 
-            return AsyncOpenAI(base_url=base_url, api_key=api_key)
+            http_client = DefaultAsyncHttpxClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+            return AsyncOpenAI(base_url=base_url, api_key=api_key, http_client=http_client)
         except Exception as e:
             logger.error(f"Failed to initialize AI client: {e}")
             raise AIServiceError(f"Failed to initialize AI client: {e}") from e
 
+    def _init_batcher(self) -> Optional[LLMBatcher]:
+        # LLM_BATCH_WINDOW_MS alone turns batching on; leave it at 0 for hosted APIs
+        if self.config.llm_batch_window_ms <= 0:
+            return None
+        return LLMBatcher(
+            self._chat_create,
+            window_ms=self.config.llm_batch_window_ms,
+            max_batch=self.config.llm_max_batch,
+        )
+
+    async def _create_completion(self, **kwargs):
+        if self._batcher is not None:
+            return await self._batcher.submit(**kwargs)
+        return await self._chat_create(**kwargs)
+
     def _get_system_prompt(self, user_language_code: str = None) -> str:
         lang_code = user_language_code or self.config.language
         user_language_name = self.LANGUAGES.get(lang_code, "English")
@@ -95,47 +174,49 @@ IMPORTANT:
 - If providing an address or phone number, put it on a new line.
 """
 
+    def _system_message(self, lang_code: str) -> dict:
+        message = self._system_messages.get(lang_code)
+        if message is None:
+            message = {"role": "system", "content": self._get_system_prompt(lang_code)}
+        return message
+
     async def aclose(self) -> None:
         try:
+            if self._batcher is not None:
+                await self._batcher.aclose()
             await self.client.close()
             logger.info("AI service client closed")
         except Exception as e:
             logger.error(f"Error closing AI service client: {e}")
 
-    async def generate_response(self, user_id: str, message: str) -> str:
+    async def generate_response(
+        self, user_id: str, message: str, user_language: Optional[str] = None
+    ) -> str:
         try:
-            # Truncate current message to prevent massive inputs
-            safe_message = message[:2000] + "..." if len(message) > 2000 else message
+            # Callers that already looked up the user's language pass it in
+            if user_language is None:
+                user_language = await self.db_service.get_user_language(user_id) or self.config.language
 
-            user_language = await self.db_service.get_user_language(user_id) or self.config.language
-            
-            # Fetch limited history
             history = await self.db_service.get_conversation_history(user_id=user_id, limit=4)
 
-            messages = [{"role": "system", "content": self._get_system_prompt(user_language)}]
-            
-            # Add history with truncation to ensure safety
-            for msg in history:
-                content = msg["content"]
-                if len(content) > 500:
-                    content = content[:500] + "..."
-                messages.append({"role": msg["role"], "content": content})
-            
-            messages.append({"role": "user", "content": safe_message})
-
-            response = await self.client.chat.completions.create(
-                model=self.model_name,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=1000,
-            )
+            # Only a user's opening message is answered from the shared cache;
+            # once there is history the reply depends on their own conversation
+            cache_key = None
+            ai_response = None
+            if self._response_cache is not None and not history:
+                cache_key = self._response_cache_key(user_language, message)
+                ai_response = self._response_cache.get(cache_key)
 
-            ai_response = response.choices[0].message.content.strip()
-            ai_response = re.sub(r"^[\s\S]*?<\/think>\s*", "", ai_response)
-            ai_response = strip_markdown_formatting(ai_response)
+            if ai_response is None:
+                ai_response = await self._complete(history, user_language, message)
+                if cache_key is not None:
+                    self._response_cache.set(cache_key, ai_response)
+            else:
+                logger.info(f"Response cache hit for user {user_id[:8]}...")
 
-            await self.db_service.save_message(user_id, "user", message)
-            await self.db_service.save_message(user_id, "assistant", ai_response)
+            # Nothing is written until there is a reply, so a failed completion
+            # never leaves an unanswered user turn in the history
+            await self._save_reply(user_id, message, ai_response)
 
             logger.info(f"Response for user {user_id[:8]}... in {user_language}")
             return ai_response
@@ -143,3 +224,41 @@ IMPORTANT:
         except Exception as e:
             logger.error(f"Failed to generate response for user {user_id[:8]}: {e}")
             raise AIServiceError(f"Failed to generate AI response: {e}") from e
+
+    async def _save_reply(self, user_id: str, message: str, ai_response: str) -> None:
+        # A failed history write should not cost the user their answer.
+        # Both turns go in one transaction so they are stored together and in order.
+        try:
+            await self.db_service.save_messages(
+                user_id, [("user", message), ("assistant", ai_response)]
+            )
+        except Exception as e:
+            logger.error(f"Failed to save conversation for user {user_id[:8]}: {e}")
+
+    async def _complete(self, history: list[dict], user_language: str, message: str) -> str:
+        # Truncate current message to prevent massive inputs
+        safe_message = _truncate(message, 2000)
+
+        # Truncate each turn, then drop the oldest ones that exceed the token budget
+        history = [
+            {"role": msg["role"], "content": _truncate(msg["content"], 500)}
+            for msg in history
+        ]
+        messages = [
+            self._system_message(user_language),
+            *_trim_history(history, HISTORY_TOKEN_BUDGET),
+            {"role": "user", "content": safe_message},
+        ]
+
+        response = await self._create_completion(messages=messages, **self._completion_params)
+
+        ai_response = response.choices[0].message.content.strip()
+        ai_response = _THINK_BLOCK_RE.sub("", ai_response)
+        return strip_markdown_formatting(ai_response)
+
+    @staticmethod
+    def _response_cache_key(user_language: str, message: str) -> bytes:
+        normalized = " ".join(message.lower().split())
+        return hashlib.blake2b(
+            f"{user_language}|{normalized}".encode(), digest_size=16
+        ).digest()
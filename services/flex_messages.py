@@ -1,8 +1,192 @@
-"""Flex Message templates for IMIGO LINE Bot"""
+"""Flex Message templates for IMIGO LINE Bot
+
+The per-language messages are rendered once at import: callers receive a
+shared structure and must treat it as read-only.
+"""
+from functools import lru_cache
 from typing import Dict, Any
 
+from config import SUPPORTED_LANGUAGES
 
-def create_welcome_flex_message(language: str = "en") -> Dict[str, Any]:
+
+class _LangDict(dict):
+    """Per-language table that falls back to the English entry"""
+
+    __slots__ = ()
+
+    def __missing__(self, language: str) -> Any:
+        return self["en"]
+
+
+# Building blocks shared by several bubbles
+_SEPARATOR_LG = {"type": "separator", "margin": "lg"}
+
+_WAVE_TEXT = {
+    "type": "text",
+    "text": "👋",
+    "size": "xxl",
+    "align": "center",
+    "margin": "md"
+}
+
+# (label, command, color) for each language-selection button
+_LANG_BUTTON_SPEC = (
+    ("🇬🇧 English", "/lang en", "#1E90FF"),
+    ("🇹🇼 繁體中文", "/lang zh", "#FF6347"),
+    ("🇮🇩 Bahasa Indonesia", "/lang id", "#32CD32"),
+    ("🇻🇳 Tiếng Việt", "/lang vi", "#FFD700"),
+)
+
+
+def _message_button(label: str, text: str, color: str) -> Dict[str, Any]:
+    return {
+        "type": "button",
+        "action": {
+            "type": "message",
+            "label": label,
+            "text": text
+        },
+        "style": "primary",
+        "color": color
+    }
+
+
+_LANG_BUTTONS = [_message_button(*spec) for spec in _LANG_BUTTON_SPEC]
+_LANG_BUTTONS_SM = [{**button, "height": "sm"} for button in _LANG_BUTTONS]
+
+# (welcome, subtitle, select-language prompt) per language
+_WELCOME_STRINGS = _LangDict({
+    "en": (
+        "Welcome to IMIGO!",
+        "Your AI assistant for migrant workers in Taiwan",
+        "Please select your preferred language:",
+    ),
+    "zh": (
+        "歡迎使用 IMIGO！",
+        "您在台灣的 AI 助手",
+        "請選擇您的語言：",
+    ),
+    "id": (
+        "Selamat datang di IMIGO!",
+        "Asisten AI Anda di Taiwan",
+        "Silakan pilih bahasa Anda:",
+    ),
+    "vi": (
+        "Chào mừng đến với IMIGO!",
+        "Trợ lý AI của bạn tại Đài Loan",
+        "Vui lòng chọn ngôn ngữ của bạn:",
+    ),
+})
+
+# (title, (labor, government, healthcare, translate, daily, emergency)) per language
+_HELP_STRINGS = _LangDict({
+    "en": (
+        "How can I help you?",
+        (
+            "💼 Work Issues",
+            "🏛️ Government Services",
+            "🏥 Healthcare",
+            "🌐 Translation",
+            "🏠 Daily Life",
+            "🚨 Emergency",
+        ),
+    ),
+    "zh": (
+        "我能幫您什麼？",
+        (
+            "💼 工作問題",
+            "🏛️ 政府服務",
+            "🏥 醫療保健",
+            "🌐 翻譯",
+            "🏠 日常生活",
+            "🚨 緊急聯絡",
+        ),
+    ),
+    "id": (
+        "Bagaimana saya bisa membantu?",
+        (
+            "💼 Masalah Kerja",
+            "🏛️ Layanan Pemerintah",
+            "🏥 Kesehatan",
+            "🌐 Terjemahan",
+            "🏠 Kehidupan Sehari-hari",
+            "🚨 Darurat",
+        ),
+    ),
+    "vi": (
+        "Tôi có thể giúp gì?",
+        (
+            "💼 Vấn Đề Công Việc",
+            "🏛️ Dịch Vụ Chính Phủ",
+            "🏥 Y Tế",
+            "🌐 Dịch Thuật",
+            "🏠 Cuộc Sống Hàng Ngày",
+            "🚨 Khẩn Cấp",
+        ),
+    ),
+})
+
+# (title, contact labels in _EMERGENCY_LABEL_KEYS order) per language
+_EMERGENCY_LABEL_KEYS = (
+    "police", "fire", "worker", "indonesia", "vietnam", "philippines", "labor", "trafficking"
+)
+_EMERGENCY_STRINGS = _LangDict({
+    "en": (
+        "🚨 Emergency Contacts",
+        (
+            "Police",
+            "Fire/Ambulance",
+            "Worker Hotline",
+            "Indonesia Office (KDEI)",
+            "Vietnam Office (VECO)",
+            "Philippines Office (MECO)",
+            "Labor Bureau",
+            "Anti-Trafficking",
+        ),
+    ),
+    "zh": (
+        "🚨 緊急聯絡電話",
+        (
+            "警察",
+            "消防/救護車",
+            "外勞專線",
+            "印尼代表處 (KDEI)",
+            "越南代表處 (VECO)",
+            "菲律賓代表處 (MECO)",
+            "勞工局",
+            "反人口販運",
+        ),
+    ),
+    "id": (
+        "🚨 Kontak Darurat",
+        (
+            "Polisi",
+            "Pemadam/Ambulans",
+            "Hotline Pekerja",
+            "Kantor Indonesia (KDEI)",
+            "Kantor Vietnam (VECO)",
+            "Kantor Filipina (MECO)",
+            "Dinas Tenaga Kerja",
+            "Anti Perdagangan",
+        ),
+    ),
+    "vi": (
+        "🚨 Liên Hệ Khẩn Cấp",
+        (
+            "Cảnh Sát",
+            "Cứu Hỏa/Cấp Cứu",
+            "Đường Dây Nóng",
+            "Văn Phòng Indonesia (KDEI)",
+            "Văn Phòng Việt Nam (VECO)",
+            "Văn Phòng Philippines (MECO)",
+            "Cục Lao Động",
+            "Chống Buôn Người",
+        ),
+    ),
+})
+
+
+def _build_welcome_flex_message(language: str = "en") -> Dict[str, Any]:
     """
     Create a welcome flex message with language selection buttons
 
@@ -12,27 +196,7 @@ def create_welcome_flex_message(language: str = "en") -> Dict[str, Any]:
     Returns:
         Flex message JSON structure
     """
-    # Multi-language welcome texts
-    welcome_texts = {
-        "en": "Welcome to IMIGO!",
-        "zh": "歡迎使用 IMIGO！",
-        "id": "Selamat datang di IMIGO!",
-        "vi": "Chào mừng đến với IMIGO!",
-    }
-
-    subtitle_texts = {
-        "en": "Your AI assistant for migrant workers in Taiwan",
-        "zh": "您在台灣的 AI 助手",
-        "id": "Asisten AI Anda di Taiwan",
-        "vi": "Trợ lý AI của bạn tại Đài Loan",
-    }
-
-    select_language_texts = {
-        "en": "Please select your preferred language:",
-        "zh": "請選擇您的語言：",
-        "id": "Silakan pilih bahasa Anda:",
-        "vi": "Vui lòng chọn ngôn ngữ của bạn:",
-    }
+    welcome, subtitle, select_language = _WELCOME_STRINGS[language]
 
     return {
         "type": "bubble",
@@ -40,16 +204,10 @@ def create_welcome_flex_message(language: str = "en") -> Dict[str, Any]:
             "type": "box",
             "layout": "vertical",
             "contents": [
+                _WAVE_TEXT,
                 {
                     "type": "text",
-                    "text": "👋",
-                    "size": "xxl",
-                    "align": "center",
-                    "margin": "md"
-                },
-                {
-                    "type": "text",
-                    "text": welcome_texts.get(language, welcome_texts["en"]),
+                    "text": welcome,
                     "weight": "bold",
                     "size": "xl",
                     "align": "center",
@@ -58,7 +216,7 @@ def create_welcome_flex_message(language: str = "en") -> Dict[str, Any]:
                 },
                 {
                     "type": "text",
-                    "text": subtitle_texts.get(language, subtitle_texts["en"]),
+                    "text": subtitle,
                     "size": "sm",
                     "align": "center",
                     "color": "#666666",
@@ -75,221 +233,162 @@ def create_welcome_flex_message(language: str = "en") -> Dict[str, Any]:
             "contents": [
                 {
                     "type": "text",
-                    "text": select_language_texts.get(language, select_language_texts["en"]),
+                    "text": select_language,
                     "weight": "bold",
                     "size": "md",
                     "margin": "md",
                     "wrap": True
                 },
-                {
-                    "type": "separator",
-                    "margin": "lg"
-                },
+                _SEPARATOR_LG,
                 {
                     "type": "box",
                     "layout": "vertical",
                     "margin": "lg",
                     "spacing": "sm",
-                    "contents": [
-                        {
-                            "type": "button",
-                            "action": {
-                                "type": "message",
-                                "label": "🇬🇧 English",
-                                "text": "/lang en"
-                            },
-                            "style": "primary",
-                            "color": "#1E90FF"
-                        },
-                        {
-                            "type": "button",
-                            "action": {
-                                "type": "message",
-                                "label": "🇹🇼 繁體中文",
-                                "text": "/lang zh"
-                            },
-                            "style": "primary",
-                            "color": "#FF6347"
-                        },
-                        {
-                            "type": "button",
-                            "action": {
-                                "type": "message",
-                                "label": "🇮🇩 Bahasa Indonesia",
-                                "text": "/lang id"
-                            },
-                            "style": "primary",
-                            "color": "#32CD32"
-                        },
-                        {
-                            "type": "button",
-                            "action": {
-                                "type": "message",
-                                "label": "🇻🇳 Tiếng Việt",
-                                "text": "/lang vi"
-                            },
-                            "style": "primary",
-                            "color": "#FFD700"
-                        }
-                    ]
+                    "contents": _LANG_BUTTONS
                 }
             ]
         }
     }
 
 
+# Multi-language welcome for brand new users, shown before they pick a language
+_NEW_USER_WELCOME_FLEX = {
+    "type": "bubble",
+    "hero": {
+        "type": "box",
+        "layout": "vertical",
+        "contents": [
+            _WAVE_TEXT,
+            {
+                "type": "text",
+                "text": "IMIGO",
+                "weight": "bold",
+                "size": "xxl",
+                "align": "center",
+                "color": "#1E90FF",
+                "margin": "md"
+            },
+            {
+                "type": "text",
+                "text": "AI Assistant for Migrant Workers",
+                "size": "xs",
+                "align": "center",
+                "color": "#666666",
+                "margin": "sm"
+            }
+        ],
+        "backgroundColor": "#F0F8FF",
+        "paddingAll": "20px"
+    },
+    "body": {
+        "type": "box",
+        "layout": "vertical",
+        "contents": [
+            {
+                "type": "text",
+                "text": "🌐 Choose Your Language",
+                "weight": "bold",
+                "size": "lg",
+                "align": "center",
+                "margin": "md"
+            },
+            {
+                "type": "text",
+                "text": "選擇您的語言",
+                "size": "sm",
+                "align": "center",
+                "color": "#666666"
+            },
+            {
+                "type": "text",
+                "text": "Pilih Bahasa Anda",
+                "size": "sm",
+                "align": "center",
+                "color": "#666666"
+            },
+            {
+                "type": "text",
+                "text": "Chọn Ngôn Ngữ",
+                "size": "sm",
+                "align": "center",
+                "color": "#666666",
+                "margin": "none"
+            },
+            _SEPARATOR_LG,
+            {
+                "type": "box",
+                "layout": "vertical",
+                "margin": "lg",
+                "spacing": "sm",
+                "contents": _LANG_BUTTONS_SM
+            }
+        ]
+    },
+    "footer": {
+        "type": "box",
+        "layout": "vertical",
+        "contents": [
+            {
+                "type": "text",
+                "text": "We can help with work, health, translation, and more!",
+                "size": "xxs",
+                "color": "#888888",
+                "align": "center",
+                "wrap": True
+            }
+        ]
+    }
+}
+
+
 def create_new_user_welcome_flex() -> Dict[str, Any]:
     """
-    Create a multi-language welcome flex message for brand new users
+    Get the multi-language welcome flex message for brand new users
     Shows welcome in all languages before they select one
 
     Returns:
-        Flex message JSON structure
+        Flex message JSON structure (shared, read-only)
     """
-    return {
-        "type": "bubble",
-        "hero": {
-            "type": "box",
-            "layout": "vertical",
-            "contents": [
-                {
-                    "type": "text",
-                    "text": "👋",
-                    "size": "xxl",
-                    "align": "center",
-                    "margin": "md"
-                },
-                {
-                    "type": "text",
-                    "text": "IMIGO",
-                    "weight": "bold",
-                    "size": "xxl",
-                    "align": "center",
-                    "color": "#1E90FF",
-                    "margin": "md"
-                },
-                {
-                    "type": "text",
-                    "text": "AI Assistant for Migrant Workers",
-                    "size": "xs",
-                    "align": "center",
-                    "color": "#666666",
-                    "margin": "sm"
-                }
-            ],
-            "backgroundColor": "#F0F8FF",
-            "paddingAll": "20px"
-        },
-        "body": {
-            "type": "box",
-            "layout": "vertical",
-            "contents": [
-                {
-                    "type": "text",
-                    "text": "🌐 Choose Your Language",
-                    "weight": "bold",
-                    "size": "lg",
-                    "align": "center",
-                    "margin": "md"
-                },
-                {
-                    "type": "text",
-                    "text": "選擇您的語言",
-                    "size": "sm",
-                    "align": "center",
-                    "color": "#666666"
-                },
-                {
-                    "type": "text",
-                    "text": "Pilih Bahasa Anda",
-                    "size": "sm",
-                    "align": "center",
-                    "color": "#666666"
-                },
-                {
-                    "type": "text",
-                    "text": "Chọn Ngôn Ngữ",
-                    "size": "sm",
-                    "align": "center",
-                    "color": "#666666",
-                    "margin": "none"
-                },
-                {
-                    "type": "separator",
-                    "margin": "lg"
-                },
-                {
-                    "type": "box",
-                    "layout": "vertical",
-                    "margin": "lg",
-                    "spacing": "sm",
-                    "contents": [
-                        {
-                            "type": "button",
-                            "action": {
-                                "type": "message",
-                                "label": "🇬🇧 English",
-                                "text": "/lang en"
-                            },
-                            "style": "primary",
-                            "color": "#1E90FF",
-                            "height": "sm"
-                        },
-                        {
-                            "type": "button",
-                            "action": {
-                                "type": "message",
-                                "label": "🇹🇼 繁體中文",
-                                "text": "/lang zh"
-                            },
-                            "style": "primary",
-                            "color": "#FF6347",
-                            "height": "sm"
-                        },
-                        {
-                            "type": "button",
-                            "action": {
-                                "type": "message",
-                                "label": "🇮🇩 Bahasa Indonesia",
-                                "text": "/lang id"
-                            },
-                            "style": "primary",
-                            "color": "#32CD32",
-                            "height": "sm"
-                        },
-                        {
-                            "type": "button",
-                            "action": {
-                                "type": "message",
-                                "label": "🇻🇳 Tiếng Việt",
-                                "text": "/lang vi"
-                            },
-                            "style": "primary",
-                            "color": "#FFD700",
-                            "height": "sm"
-                        }
-                    ]
-                }
-            ]
-        },
-        "footer": {
-            "type": "box",
-            "layout": "vertical",
-            "contents": [
-                {
-                    "type": "text",
-                    "text": "We can help with work, health, translation, and more!",
-                    "size": "xxs",
-                    "color": "#888888",
-                    "align": "center",
-                    "wrap": True
-                }
-            ]
+    return _NEW_USER_WELCOME_FLEX
+
+
+# (category, color, top margin) for each help menu button, in label order
+_HELP_BUTTON_SPEC = (
+    ("labor", "#1E90FF", "md"),
+    ("government", "#FF6347", "sm"),
+    ("healthcare", "#32CD32", "sm"),
+    ("translate", "#FFD700", "sm"),
+    ("daily", "#9370DB", "sm"),
+    ("emergency", "#DC143C", "sm"),
+)
+
+# Postback data sent when a category button is tapped (see CATEGORY_PROMPTS in main)
+_CATEGORY_POSTBACK_DATA = {category: f"category_{category}" for category, _, _ in _HELP_BUTTON_SPEC}
+
+
+def _help_button(category: str, label: str, color: str, margin: str) -> Dict[str, Any]:
+    # Emergency opens the contacts card directly; other categories go to the LLM
+    if category == "emergency":
+        action = {"type": "message", "label": label, "text": "/emergency"}
+    else:
+        action = {
+            "type": "postback",
+            "label": label,
+            "data": _CATEGORY_POSTBACK_DATA[category],
+            "displayText": label
         }
+    return {
+        "type": "button",
+        "action": action,
+        "style": "primary",
+        "color": color,
+        "margin": margin,
+        "height": "sm"
     }
 
 
-def create_help_flex_message(language: str = "en") -> Dict[str, Any]:
+def _build_help_flex_message(language: str = "en") -> Dict[str, Any]:
     """
     Create a help menu flex message with category buttons
 
@@ -299,49 +398,7 @@ def create_help_flex_message(language: str = "en") -> Dict[str, Any]:
     Returns:
         Flex message JSON structure
     """
-    help_titles = {
-        "en": "How can I help you?",
-        "zh": "我能幫您什麼？",
-        "id": "Bagaimana saya bisa membantu?",
-        "vi": "Tôi có thể giúp gì?",
-    }
-
-    categories = {
-        "en": {
-            "labor": "💼 Work Issues",
-            "government": "🏛️ Government Services",
-            "healthcare": "🏥 Healthcare",
-            "translate": "🌐 Translation",
-            "daily": "🏠 Daily Life",
-            "emergency": "🚨 Emergency",
-        },
-        "zh": {
-            "labor": "💼 工作問題",
-            "government": "🏛️ 政府服務",
-            "healthcare": "🏥 醫療保健",
-            "translate": "🌐 翻譯",
-            "daily": "🏠 日常生活",
-            "emergency": "🚨 緊急聯絡",
-        },
-        "id": {
-            "labor": "💼 Masalah Kerja",
-            "government": "🏛️ Layanan Pemerintah",
-            "healthcare": "🏥 Kesehatan",
-            "translate": "🌐 Terjemahan",
-            "daily": "🏠 Kehidupan Sehari-hari",
-            "emergency": "🚨 Darurat",
-        },
-        "vi": {
-            "labor": "💼 Vấn Đề Công Việc",
-            "government": "🏛️ Dịch Vụ Chính Phủ",
-            "healthcare": "🏥 Y Tế",
-            "translate": "🌐 Dịch Thuật",
-            "daily": "🏠 Cuộc Sống Hàng Ngày",
-            "emergency": "🚨 Khẩn Cấp",
-        }
-    }
-
-    lang_categories = categories.get(language, categories["en"])
+    title, labels = _HELP_STRINGS[language]
 
     return {
         "type": "bubble",
@@ -351,7 +408,7 @@ def create_help_flex_message(language: str = "en") -> Dict[str, Any]:
             "contents": [
                 {
                     "type": "text",
-                    "text": help_titles.get(language, help_titles["en"]),
+                    "text": title,
                     "weight": "bold",
                     "size": "xl",
                     "color": "#FFFFFF"
@@ -364,89 +421,55 @@ def create_help_flex_message(language: str = "en") -> Dict[str, Any]:
             "type": "box",
             "layout": "vertical",
             "contents": [
-                {
-                    "type": "button",
-                    "action": {
-                        "type": "postback",
-                        "label": lang_categories["labor"],
-                        "data": "category_labor",
-                        "displayText": lang_categories["labor"]
-                    },
-                    "style": "primary",
-                    "color": "#1E90FF",
-                    "margin": "md",
-                    "height": "sm"
-                },
-                {
-                    "type": "button",
-                    "action": {
-                        "type": "postback",
-                        "label": lang_categories["government"],
-                        "data": "category_government",
-                        "displayText": lang_categories["government"]
-                    },
-                    "style": "primary",
-                    "color": "#FF6347",
-                    "margin": "sm",
-                    "height": "sm"
-                },
-                {
-                    "type": "button",
-                    "action": {
-                        "type": "postback",
-                        "label": lang_categories["healthcare"],
-                        "data": "category_healthcare",
-                        "displayText": lang_categories["healthcare"]
-                    },
-                    "style": "primary",
-                    "color": "#32CD32",
-                    "margin": "sm",
-                    "height": "sm"
-                },
-                {
-                    "type": "button",
-                    "action": {
-                        "type": "postback",
-                        "label": lang_categories["translate"],
-                        "data": "category_translate",
-                        "displayText": lang_categories["translate"]
-                    },
-                    "style": "primary",
-                    "color": "#FFD700",
-                    "margin": "sm",
-                    "height": "sm"
-                },
-                {
-                    "type": "button",
-                    "action": {
-                        "type": "postback",
-                        "label": lang_categories["daily"],
-                        "data": "category_daily",
-                        "displayText": lang_categories["daily"]
-                    },
-                    "style": "primary",
-                    "color": "#9370DB",
-                    "margin": "sm",
-                    "height": "sm"
-                },
-                {
-                    "type": "button",
-                    "action": {
-                        "type": "message",
-                        "label": lang_categories["emergency"],
-                        "text": "/emergency"
-                    },
-                    "style": "primary",
-                    "color": "#DC143C",
-                    "margin": "sm",
-                    "height": "sm"
-                }
+                _help_button(category, label, color, margin)
+                for (category, color, margin), label in zip(_HELP_BUTTON_SPEC, labels)
             ]
         }
     }
 
 
-def create_emergency_flex_message(language: str = "en") -> Dict[str, Any]:
+# (label key, number, urgent) for each contact row; None marks a separator
+_EMERGENCY_ROWS = (
+    ("police", "110", True),
+    ("fire", "119", True),
+    None,
+    ("worker", "1955", False),
+    ("indonesia", "+886-2-2356-5156", False),
+    ("vietnam", "+886-2-2516-6626", False),
+    ("philippines", "+886-2-2508-1719", False),
+    None,
+    ("trafficking", "113", False),
+)
+
+
+@lru_cache(maxsize=64)
+def _make_contact_box(label: str, number: str, urgent: bool = False) -> Dict[str, Any]:
+    return {
+        "type": "box",
+        "layout": "horizontal",
+        "contents": [
+            {
+                "type": "text",
+                "text": label,
+                "size": "sm",
+                "color": "#555555",
+                "flex": 0,
+                "weight": "bold" if urgent else "regular"
+            },
+            {
+                "type": "text",
+                "text": number,
+                "size": "sm",
+                "color": "#DC143C" if urgent else "#1E90FF",
+                "align": "end",
+                "weight": "bold"
+            }
+        ],
+        "margin": "md"
+    }
+
+
+def _build_emergency_flex_message(language: str = "en") -> Dict[str, Any]:
     """
     Create emergency contacts flex message
 
@@ -456,82 +479,8 @@ def create_emergency_flex_message(language: str = "en") -> Dict[str, Any]:
     Returns:
         Flex message JSON structure
     """
-    emergency_titles = {
-        "en": "🚨 Emergency Contacts",
-        "zh": "🚨 緊急聯絡電話",
-        "id": "🚨 Kontak Darurat",
-        "vi": "🚨 Liên Hệ Khẩn Cấp",
-    }
-
-    contact_labels = {
-        "en": {
-            "police": "Police",
-            "fire": "Fire/Ambulance",
-            "worker": "Worker Hotline",
-            "indonesia": "Indonesia Office (KDEI)",
-            "vietnam": "Vietnam Office (VECO)",
-            "philippines": "Philippines Office (MECO)",
-            "labor": "Labor Bureau",
-            "trafficking": "Anti-Trafficking"
-        },
-        "zh": {
-            "police": "警察",
-            "fire": "消防/救護車",
-            "worker": "外勞專線",
-            "indonesia": "印尼代表處 (KDEI)",
-            "vietnam": "越南代表處 (VECO)",
-            "philippines": "菲律賓代表處 (MECO)",
-            "labor": "勞工局",
-            "trafficking": "反人口販運"
-        },
-        "id": {
-            "police": "Polisi",
-            "fire": "Pemadam/Ambulans",
-            "worker": "Hotline Pekerja",
-            "indonesia": "Kantor Indonesia (KDEI)",
-            "vietnam": "Kantor Vietnam (VECO)",
-            "philippines": "Kantor Filipina (MECO)",
-            "labor": "Dinas Tenaga Kerja",
-            "trafficking": "Anti Perdagangan"
-        },
-        "vi": {
-            "police": "Cảnh Sát",
-            "fire": "Cứu Hỏa/Cấp Cứu",
-            "worker": "Đường Dây Nóng",
-            "indonesia": "Văn Phòng Indonesia (KDEI)",
-            "vietnam": "Văn Phòng Việt Nam (VECO)",
-            "philippines": "Văn Phòng Philippines (MECO)",
-            "labor": "Cục Lao Động",
-            "trafficking": "Chống Buôn Người"
-        }
-    }
-
-    labels = contact_labels.get(language, contact_labels["en"])
-
-    def create_contact_box(label: str, number: str, urgent: bool = False) -> Dict[str, Any]:
-        return {
-            "type": "box",
-            "layout": "horizontal",
-            "contents": [
-                {
-                    "type": "text",
-                    "text": label,
-                    "size": "sm",
-                    "color": "#555555",
-                    "flex": 0,
-                    "weight": "bold" if urgent else "regular"
-                },
-                {
-                    "type": "text",
-                    "text": number,
-                    "size": "sm",
-                    "color": "#DC143C" if urgent else "#1E90FF",
-                    "align": "end",
-                    "weight": "bold"
-                }
-            ],
-            "margin": "md"
-        }
+    title, names = _EMERGENCY_STRINGS[language]
+    labels = dict(zip(_EMERGENCY_LABEL_KEYS, names))
 
     return {
         "type": "bubble",
@@ -541,7 +490,7 @@ def create_emergency_flex_message(language: str = "en") -> Dict[str, Any]:
             "contents": [
                 {
                     "type": "text",
-                    "text": emergency_titles.get(language, emergency_titles["en"]),
+                    "text": title,
                     "weight": "bold",
                     "size": "xl",
                     "color": "#FFFFFF"
@@ -554,21 +503,8 @@ def create_emergency_flex_message(language: str = "en") -> Dict[str, Any]:
             "type": "box",
             "layout": "vertical",
             "contents": [
-                create_contact_box(labels["police"], "110", urgent=True),
-                create_contact_box(labels["fire"], "119", urgent=True),
-                {
-                    "type": "separator",
-                    "margin": "lg"
-                },
-                create_contact_box(labels["worker"], "1955"),
-                create_contact_box(labels["indonesia"], "+886-2-2356-5156"),
-                create_contact_box(labels["vietnam"], "+886-2-2516-6626"),
-                create_contact_box(labels["philippines"], "+886-2-2508-1719"),
-                {
-                    "type": "separator",
-                    "margin": "lg"
-                },
-                create_contact_box(labels["trafficking"], "113"),
+                _SEPARATOR_LG if row is None else _make_contact_box(labels[row[0]], *row[1:])
+                for row in _EMERGENCY_ROWS
             ]
         },
         "footer": {
@@ -590,64 +526,66 @@ def create_emergency_flex_message(language: str = "en") -> Dict[str, Any]:
     }
 
 
-def create_category_carousel(language: str = "en") -> Dict[str, Any]:
+# Carousel card title and description per language and category
+_CAROUSEL_CATEGORIES = _LangDict({
+    "en": {
+        "labor": {"title": "💼 Work Issues", "desc": "Labor rights, disputes, and regulations"},
+        "government": {"title": "🏛️ Govt Services", "desc": "Permits, taxes, and legal docs"},
+        "healthcare": {"title": "🏥 Healthcare", "desc": "Hospitals, insurance, and medical info"},
+        "translate": {"title": "🌐 Translation", "desc": "Translate text or voice instantly"},
+        "daily": {"title": "🏠 Daily Life", "desc": "Transport, housing, and living tips"},
+        "emergency": {"title": "🚨 Emergency", "desc": "Police, ambulance, and hotlines"},
+    },
+    "zh": {
+        "labor": {"title": "💼 工作問題", "desc": "勞工權益、糾紛與法規"},
+        "government": {"title": "🏛️ 政府服務", "desc": "居留證、稅務與法律文件"},
+        "healthcare": {"title": "🏥 醫療保健", "desc": "醫院、健保與醫療資訊"},
+        "translate": {"title": "🌐 翻譯服務", "desc": "即時文字或語音翻譯"},
+        "daily": {"title": "🏠 日常生活", "desc": "交通、住宿與生活小撇步"},
+        "emergency": {"title": "🚨 緊急聯絡", "desc": "警察、救護車與求助專線"},
+    },
+    "id": {
+        "labor": {"title": "💼 Masalah Kerja", "desc": "Hak pekerja, perselisihan, dan aturan"},
+        "government": {"title": "🏛️ Layanan Govt", "desc": "Izin, pajak, dan dokumen hukum"},
+        "healthcare": {"title": "🏥 Kesehatan", "desc": "RS, asuransi, dan info medis"},
+        "translate": {"title": "🌐 Terjemahan", "desc": "Terjemahkan teks/suara instan"},
+        "daily": {"title": "🏠 Sehari-hari", "desc": "Transportasi, hunian, dan tips"},
+        "emergency": {"title": "🚨 Darurat", "desc": "Polisi, ambulans, dan hotline"},
+    },
+    "vi": {
+        "labor": {"title": "💼 Công Việc", "desc": "Quyền lợi, tranh chấp, quy định"},
+        "government": {"title": "🏛️ Chính Phủ", "desc": "Giấy tờ, thuế, pháp lý"},
+        "healthcare": {"title": "🏥 Y Tế", "desc": "Bệnh viện, bảo hiểm, y khoa"},
+        "translate": {"title": "🌐 Dịch Thuật", "desc": "Dịch văn bản hoặc giọng nói"},
+        "daily": {"title": "🏠 Đời Sống", "desc": "Đi lại, nhà ở, mẹo vặt"},
+        "emergency": {"title": "🚨 Khẩn Cấp", "desc": "Cảnh sát, cấp cứu, đường dây nóng"},
+    }
+})
+
+# Carousel cards reuse the help menu palette, in the same order
+_CATEGORY_COLORS = {category: color for category, color, _ in _HELP_BUTTON_SPEC}
+
+
+def _build_category_carousel(language: str = "en") -> Dict[str, Any]:
     """
     Create a carousel menu for service categories
     """
-    categories = {
-        "en": {
-            "labor": {"title": "💼 Work Issues", "desc": "Labor rights, disputes, and regulations"},
-            "government": {"title": "🏛️ Govt Services", "desc": "Permits, taxes, and legal docs"},
-            "healthcare": {"title": "🏥 Healthcare", "desc": "Hospitals, insurance, and medical info"},
-            "translate": {"title": "🌐 Translation", "desc": "Translate text or voice instantly"},
-            "daily": {"title": "🏠 Daily Life", "desc": "Transport, housing, and living tips"},
-            "emergency": {"title": "🚨 Emergency", "desc": "Police, ambulance, and hotlines"},
-        },
-        "zh": {
-            "labor": {"title": "💼 工作問題", "desc": "勞工權益、糾紛與法規"},
-            "government": {"title": "🏛️ 政府服務", "desc": "居留證、稅務與法律文件"},
-            "healthcare": {"title": "🏥 醫療保健", "desc": "醫院、健保與醫療資訊"},
-            "translate": {"title": "🌐 翻譯服務", "desc": "即時文字或語音翻譯"},
-            "daily": {"title": "🏠 日常生活", "desc": "交通、住宿與生活小撇步"},
-            "emergency": {"title": "🚨 緊急聯絡", "desc": "警察、救護車與求助專線"},
-        },
-        "id": {
-            "labor": {"title": "💼 Masalah Kerja", "desc": "Hak pekerja, perselisihan, dan aturan"},
-            "government": {"title": "🏛️ Layanan Govt", "desc": "Izin, pajak, dan dokumen hukum"},
-            "healthcare": {"title": "🏥 Kesehatan", "desc": "RS, asuransi, dan info medis"},
-            "translate": {"title": "🌐 Terjemahan", "desc": "Terjemahkan teks/suara instan"},
-            "daily": {"title": "🏠 Sehari-hari", "desc": "Transportasi, hunian, dan tips"},
-            "emergency": {"title": "🚨 Darurat", "desc": "Polisi, ambulans, dan hotline"},
-        },
-        "vi": {
-            "labor": {"title": "💼 Công Việc", "desc": "Quyền lợi, tranh chấp, quy định"},
-            "government": {"title": "🏛️ Chính Phủ", "desc": "Giấy tờ, thuế, pháp lý"},
-            "healthcare": {"title": "🏥 Y Tế", "desc": "Bệnh viện, bảo hiểm, y khoa"},
-            "translate": {"title": "🌐 Dịch Thuật", "desc": "Dịch văn bản hoặc giọng nói"},
-            "daily": {"title": "🏠 Đời Sống", "desc": "Đi lại, nhà ở, mẹo vặt"},
-            "emergency": {"title": "🚨 Khẩn Cấp", "desc": "Cảnh sát, cấp cứu, đường dây nóng"},
-        }
-    }
-
-    texts = categories.get(language, categories["en"])
+    texts = _CAROUSEL_CATEGORIES[language]
 
     bubbles = []
-    
-    # Order of keys to display
-    keys = ["labor", "government", "healthcare", "translate", "daily", "emergency"]
 
-    for key in keys:
+    for key, color in _CATEGORY_COLORS.items():
         data = texts[key]
-        # Define color based on original mapping (simplified here or reuse)
-        colors = {
-            "labor": "#1E90FF",
-            "government": "#FF6347",
-            "healthcare": "#32CD32",
-            "translate": "#FFD700",
-            "daily": "#9370DB",
-            "emergency": "#DC143C"
-        }
-        color = colors.get(key, "#1E90FF")
+        # Only emit the fields each action type uses; LINE ignores nulls
+        if key == "emergency":
+            action = {"type": "message", "label": "Select", "text": "/emergency"}
+        else:
+            action = {
+                "type": "postback",
+                "label": "Select",
+                "data": _CATEGORY_POSTBACK_DATA[key],
+                "displayText": data["title"]
+            }
 
         bubbles.append({
             "type": "bubble",
@@ -689,13 +627,7 @@ def create_category_carousel(language: str = "en") -> Dict[str, Any]:
                 "contents": [
                     {
                         "type": "button",
-                        "action": {
-                            "type": "postback" if key != "emergency" else "message",
-                            "label": "Select",
-                            "data": f"category_{key}" if key != "emergency" else None,
-                            "text": "/emergency" if key == "emergency" else None,
-                            "displayText": data["title"] if key != "emergency" else None
-                        },
+                        "action": action,
                         "style": "secondary",
                         "height": "sm"
                     }
@@ -708,3 +640,30 @@ def create_category_carousel(language: str = "en") -> Dict[str, Any]:
         "type": "carousel",
         "contents": bubbles
     }
+
+
+# Render every supported language up front; unknown codes fall back to English
+_WELCOME_BY_LANG = _LangDict({lang: _build_welcome_flex_message(lang) for lang in SUPPORTED_LANGUAGES})
+_HELP_BY_LANG = _LangDict({lang: _build_help_flex_message(lang) for lang in SUPPORTED_LANGUAGES})
+_EMERGENCY_BY_LANG = _LangDict({lang: _build_emergency_flex_message(lang) for lang in SUPPORTED_LANGUAGES})
+_CAROUSEL_BY_LANG = _LangDict({lang: _build_category_carousel(lang) for lang in SUPPORTED_LANGUAGES})
+
+
+def create_welcome_flex_message(language: str = "en") -> Dict[str, Any]:
+    """Get the prebuilt welcome flex message for a language"""
+    return _WELCOME_BY_LANG[language]
+
+
+def create_help_flex_message(language: str = "en") -> Dict[str, Any]:
+    """Get the prebuilt help menu flex message for a language"""
+    return _HELP_BY_LANG[language]
+
+
+def create_emergency_flex_message(language: str = "en") -> Dict[str, Any]:
+    """Get the prebuilt emergency contacts flex message for a language"""
+    return _EMERGENCY_BY_LANG[language]
+
+
+def create_category_carousel(language: str = "en") -> Dict[str, Any]:
+    """Get the prebuilt service category carousel for a language"""
+    return _CAROUSEL_BY_LANG[language]
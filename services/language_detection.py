@@ -1,5 +1,7 @@
 """Language detection service for auto-detecting user input language"""
 import logging
+from functools import lru_cache
+from typing import Optional
 
 from langdetect import DetectorFactory, LangDetectException, detect
 
@@ -7,6 +9,63 @@ logger = logging.getLogger(__name__)
 
 DetectorFactory.seed = 0
 
+# langdetect only needs a prefix to classify; capping the key bounds cache memory
+DETECTION_KEY_CHARS = 256
+
+
+# Besides Latin Extended Additional (ạ, ề, ữ...), these letters mark Vietnamese text
+_VIETNAMESE_LETTERS = frozenset("ăđơưĂĐƠƯ")
+
+
+def _script_hint(text: str) -> Optional[str]:
+    """Classify text by Unicode script when one script clearly dominates
+
+    Returns a langdetect-style code, or None when the text needs the full
+    classifier (other Latin-script languages, mixed text, or Latin text that
+    merely contains a Vietnamese name).
+    """
+    letters = han = thai = marked = 0
+    vietnamese = False
+    for ch in text:
+        if not ch.isalpha():
+            continue
+        letters += 1
+        code = ord(ch)
+        if 0x4E00 <= code <= 0x9FFF or 0x3400 <= code <= 0x4DBF:
+            han += 1
+        elif 0x0E00 <= code <= 0x0E7F:
+            thai += 1
+        elif 0x1EA0 <= code <= 0x1EF9 or ch in _VIETNAMESE_LETTERS:
+            vietnamese = True
+            marked += 1
+        elif 0x00C0 <= code <= 0x024F:
+            marked += 1
+
+    if not letters:
+        return None
+    if han >= 0.7 * letters:
+        return "zh-tw"
+    if thai >= 0.7 * letters:
+        return "th"
+    # Vietnamese sentences carry diacritics on a fifth or more of their letters;
+    # a name like "Trần Văn Đức" inside English or Indonesian stays well below
+    if vietnamese and marked >= 0.2 * letters:
+        return "vi"
+    return None
+
+
+@lru_cache(maxsize=8192)
+def _detect_cached(text: str) -> Optional[str]:
+    # Group chats repeat the same short messages, and detection is deterministic
+    hint = _script_hint(text)
+    if hint is not None:
+        return hint
+    try:
+        return detect(text)
+    except LangDetectException as e:
+        logger.warning(f"Language detection failed: {e}")
+        return None
+
 
 class LanguageDetectionService:
     LANGUAGE_MAP = {
@@ -36,12 +95,19 @@ class LanguageDetectionService:
             logger.warning(f"Default language '{default_language}' not supported, using 'en'")
 
     def detect_language(self, text: str) -> str:
-        if not text or not text.strip():
+        stripped = text.strip() if text else ""
+        if not stripped:
             logger.warning("Empty text provided for language detection")
             return self.default_language
 
+        # A few ASCII characters ("ok", "hi") carry too little signal to classify
+        if len(stripped) <= 3 and stripped.isascii():
+            return self.default_language
+
         try:
-            detected_lang = detect(text.strip())
+            detected_lang = _detect_cached(stripped[:DETECTION_KEY_CHARS])
+            if detected_lang is None:
+                return self.default_language
             logger.info(f"Detected language: {detected_lang} for text: {text[:50]}...")
 
             mapped_lang = self.LANGUAGE_MAP.get(detected_lang)
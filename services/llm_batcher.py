@@ -0,0 +1,96 @@
+"""Micro-batching of concurrent LLM requests for self-hosted inference servers"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LLMBatcher:
+    """
+    Coalesce concurrent chat completion calls into short dispatch windows.
+
+    vLLM/sglang continuously batch requests that arrive together, so holding
+    calls for a few milliseconds and releasing them at once lets the server
+    share one forward pass across users instead of interleaving them.
+    """
+
+    def __init__(
+        self,
+        create: Callable[..., Awaitable[Any]],
+        window_ms: int = 5,
+        max_batch: int = 8,
+    ):
+        self._create = create
+        self._window = window_ms / 1000
+        self._max_batch = max(1, max_batch)
+        self._queue: asyncio.Queue[tuple[dict, asyncio.Future]] = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: set[asyncio.Task] = set()
+
+    async def submit(self, **kwargs: Any) -> Any:
+        """Queue a completion request and wait for its result"""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((kwargs, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._window
+
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        logger.debug(f"Dispatching LLM batch of {len(batch)} request(s)")
+        results = await asyncio.gather(
+            *(self._create(**kwargs) for kwargs, _ in batch), return_exceptions=True
+        )
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                # The caller is gone; release anything it would have consumed
+                await self._discard(result)
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    async def _discard(result: Any) -> None:
+        # A streaming result holds an open HTTP response until it is closed
+        close = getattr(result, "close", None)
+        if isinstance(result, BaseException) or close is None:
+            return
+        try:
+            await close()
+        except Exception as e:
+            logger.warning(f"Failed to close dropped LLM result: {e}")
+
+    async def aclose(self) -> None:
+        tasks = [*self._inflight]
+        if self._worker is not None:
+            tasks.append(self._worker)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+        self._worker = None
+        self._inflight.clear()
@@ -1,6 +1,10 @@
 """Rich menu service for managing LINE rich menus"""
+import asyncio
 import json
 import logging
+import stat
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -19,37 +23,125 @@ from exceptions import RichMenuError
 
 logger = logging.getLogger(__name__)
 
+RICH_MENU_DIR = Path(__file__).resolve().parent.parent / "rich_menu"
+MENU_CONFIG_PATH = RICH_MENU_DIR / "menu_config.json"
+
+# Setup flows list menus several times in a row; this instance's own writes invalidate it.
+# Out-of-process changes are not seen, so callers reporting live state bypass it.
+MENU_LIST_CACHE_TTL = 30.0
+
+# A channel can hold up to 1000 menus; cap parallel deletes to stay under LINE's rate limit
+MAX_CONCURRENT_DELETES = 10
+
+
+@lru_cache(maxsize=4)
+def _load_menu_config(path: str, mtime: float) -> dict:
+    # Keyed on mtime so an edited config is re-read; callers must not mutate the result
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=4)
+def _build_menu_request(path: str, mtime: float) -> RichMenuRequest:
+    """Build the request from the config; language menus copy it with their own name"""
+    config = _load_menu_config(path, mtime)
+
+    areas = []
+    for area_config in config.get("areas", []):
+        bounds = area_config["bounds"]
+        action = area_config["action"]
+
+        # Create action based on type
+        if action["type"] == "postback":
+            line_action = PostbackAction(
+                data=action["data"],
+                displayText=action.get("displayText"),
+            )
+        else:
+            logger.warning(f"Unsupported action type: {action['type']}")
+            continue
+
+        areas.append(
+            RichMenuArea(
+                bounds=RichMenuBounds(
+                    x=bounds["x"],
+                    y=bounds["y"],
+                    width=bounds["width"],
+                    height=bounds["height"],
+                ),
+                action=line_action,
+            )
+        )
+
+    size_config = config["size"]
+    return RichMenuRequest(
+        size=RichMenuSize(width=size_config["width"], height=size_config["height"]),
+        selected=config.get("selected", True),
+        name=config.get("name", "IMIGO Menu"),
+        chatBarText=config.get("chatBarText", "Tap for Help"),
+        areas=areas,
+    )
+
+
+@lru_cache(maxsize=8)
+def _resolve_dir(path: Path) -> Path:
+    return path.resolve()
+
+
+@lru_cache(maxsize=8)
+def _load_image(path: str, mtime: float) -> bytes:
+    # The same per-language images are re-uploaded whenever menus are rebuilt
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _read_image(path: Path) -> bytes:
+    return _load_image(str(path), path.stat().st_mtime)
+
 
 class RichMenuService:
-    SUPPORTED_LANGUAGES = ["en", "id", "vi", "zh"]
+    SUPPORTED_LANGUAGES = ("en", "id", "vi", "zh")
     LANGUAGE_NAMES = {
         "en": "English Menu",
         "id": "Menu Bahasa Indonesia",
         "vi": "Thực đơn Tiếng Việt",
         "zh": "繁體中文選單",
     }
+    IMAGE_CONTENT_TYPES = {
+        ".png": "image/png",
+        ".jpg": "image/jpeg",
+        ".jpeg": "image/jpeg",
+    }
 
     def __init__(self, line_api: AsyncMessagingApi, blob_api: AsyncMessagingApiBlob):
         self.line_api = line_api
         self.blob_api = blob_api
-        self.config_path = Path(__file__).parent.parent / "rich_menu" / "menu_config.json"
-        self.rich_menu_dir = Path(__file__).parent.parent / "rich_menu"
+        self.config_path = MENU_CONFIG_PATH
+        self.rich_menu_dir = RICH_MENU_DIR
         self.language_menus: Dict[str, str] = {}
+        self._menu_list_cache: Optional[tuple[float, list]] = None
+
+    def _read_menu_config(self) -> dict:
+        return _load_menu_config(str(self.config_path), self.config_path.stat().st_mtime)
+
+    def _read_menu_request(self) -> RichMenuRequest:
+        return _build_menu_request(str(self.config_path), self.config_path.stat().st_mtime)
 
     def _validate_image_path(self, image_path: str) -> Path:
         path = Path(image_path).resolve()
 
-        if not path.exists():
+        # One stat() answers both "exists" and "is a regular file"
+        try:
+            mode = path.stat().st_mode
+        except OSError:
             raise ValueError(f"Image file does not exist: {image_path}")
-        if not path.is_file():
+        if not stat.S_ISREG(mode):
             raise ValueError(f"Path is not a file: {image_path}")
 
-        try:
-            path.relative_to(self.rich_menu_dir.resolve())
-        except ValueError:
+        if not path.is_relative_to(_resolve_dir(self.rich_menu_dir)):
             raise ValueError(f"Image path must be within the rich_menu directory: {image_path}")
 
-        if path.suffix.lower() not in {'.png', '.jpg', '.jpeg'}:
+        if path.suffix.lower() not in self.IMAGE_CONTENT_TYPES:
             raise ValueError(f"Invalid image format: {path.suffix}")
 
         return path
@@ -69,56 +161,15 @@ class RichMenuService:
             if not self.config_path.exists():
                 raise RichMenuError(f"Config file not found: {self.config_path}")
 
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
-
-            # Create rich menu areas
-            areas = []
-            for area_config in config.get("areas", []):
-                bounds = area_config["bounds"]
-                action = area_config["action"]
-
-                # Create action based on type
-                if action["type"] == "postback":
-                    line_action = PostbackAction(
-                        data=action["data"],
-                        displayText=action.get("displayText"),
-                    )
-                else:
-                    logger.warning(f"Unsupported action type: {action['type']}")
-                    continue
-
-                # Create area
-                area = RichMenuArea(
-                    bounds=RichMenuBounds(
-                        x=bounds["x"],
-                        y=bounds["y"],
-                        width=bounds["width"],
-                        height=bounds["height"],
-                    ),
-                    action=line_action,
-                )
-                areas.append(area)
-
-            if not areas:
-                raise RichMenuError("No valid areas defined in config")
+            rich_menu_request = await asyncio.to_thread(self._read_menu_request)
 
-            # Create rich menu request
-            size_config = config["size"]
-            rich_menu_request = RichMenuRequest(
-                size=RichMenuSize(
-                    width=size_config["width"],
-                    height=size_config["height"],
-                ),
-                selected=config.get("selected", True),
-                name=config.get("name", "IMIGO Menu"),
-                chatBarText=config.get("chatBarText", "Tap for Help"),
-                areas=areas,
-            )
+            if not rich_menu_request.areas:
+                raise RichMenuError("No valid areas defined in config")
 
             # Create rich menu
             response = await self.line_api.create_rich_menu(rich_menu_request)
             rich_menu_id = response.rich_menu_id
+            self._menu_list_cache = None
 
             logger.info(f"Rich menu created: {rich_menu_id}")
             return rich_menu_id
@@ -144,17 +195,14 @@ class RichMenuService:
             # Validate the image path
             validated_path = self._validate_image_path(image_path)
 
-            # Determine content type from extension
-            content_type = "image/png"
-            if validated_path.suffix.lower() in {'.jpg', '.jpeg'}:
-                content_type = "image/jpeg"
-
-            with open(validated_path, "rb") as f:
-                await self.blob_api.set_rich_menu_image(
-                    rich_menu_id=rich_menu_id,
-                    body=f.read(),
-                    _headers={"Content-Type": content_type},
-                )
+            content_type = self.IMAGE_CONTENT_TYPES[validated_path.suffix.lower()]
+
+            body = await asyncio.to_thread(_read_image, validated_path)
+            await self.blob_api.set_rich_menu_image(
+                rich_menu_id=rich_menu_id,
+                body=body,
+                _headers={"Content-Type": content_type},
+            )
             logger.info(f"Uploaded image to rich menu: {rich_menu_id}")
             return True
         except ValueError as e:
@@ -236,17 +284,49 @@ class RichMenuService:
         except Exception as e:
             logger.error(f"Failed to delete rich menu: {e}")
             return False
+        finally:
+            # Even a failed call may have deleted the menu server-side
+            self._menu_list_cache = None
+
+    async def delete_rich_menus(self, rich_menu_ids: list[str]) -> list[bool]:
+        """
+        Delete several rich menus concurrently, at most MAX_CONCURRENT_DELETES at a time
+
+        Args:
+            rich_menu_ids: IDs of the rich menus
+
+        Returns:
+            One success flag per ID, in the same order
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DELETES)
+
+        async def delete(rich_menu_id: str) -> bool:
+            async with semaphore:
+                return await self.delete_rich_menu(rich_menu_id)
+
+        return await asyncio.gather(*(delete(menu_id) for menu_id in rich_menu_ids))
 
-    async def get_rich_menu_list(self) -> list:
+    async def get_rich_menu_list(self, use_cache: bool = True) -> list:
         """
         Get list of all rich menus
 
+        Args:
+            use_cache: Reuse a listing fetched within MENU_LIST_CACHE_TTL; pass False
+                to see menus created or deleted by other processes
+
         Returns:
             List of rich menu objects
         """
+        if use_cache and self._menu_list_cache is not None:
+            fetched_at, menus = self._menu_list_cache
+            if time.monotonic() - fetched_at < MENU_LIST_CACHE_TTL:
+                return menus
+
         try:
             response = await self.line_api.get_rich_menu_list()
-            return response.richmenus if response else []
+            menus = response.richmenus if response else []
+            self._menu_list_cache = (time.monotonic(), menus)
+            return menus
         except Exception as e:
             logger.error(f"Failed to get rich menu list: {e}")
             return []
@@ -272,20 +352,13 @@ class RichMenuService:
         Returns:
             Dictionary mapping language codes to rich menu IDs
         """
-        supported_languages = ["en", "id", "vi", "zh"]
-        language_names = {
-            "en": "English Menu",
-            "id": "Menu Bahasa Indonesia",
-            "vi": "Thực đơn Tiếng Việt",
-            "zh": "繁體中文選單"
-        }
-
         # Get existing rich menus
         existing_menus = await self.get_rich_menu_list()
         existing_menu_map = {menu.name: menu.rich_menu_id for menu in existing_menus}
 
-        for lang in supported_languages:
-            menu_name = language_names.get(lang, f"{lang.upper()} Menu")
+        missing = []
+        for lang in self.SUPPORTED_LANGUAGES:
+            menu_name = self.LANGUAGE_NAMES.get(lang, f"{lang.upper()} Menu")
 
             # Check if menu already exists
             if menu_name in existing_menu_map:
@@ -293,32 +366,53 @@ class RichMenuService:
                 logger.info(f"Reusing existing rich menu for language {lang}: {existing_menu_map[menu_name]}")
                 continue
 
-            # Create new menu if it doesn't exist
-            image_path = self.rich_menu_dir / f"menu_{lang}.png"
-
-            if not image_path.exists():
-                logger.warning(f"Image not found for language {lang}: {image_path}")
-                continue
+            missing.append((lang, menu_name))
 
+        if missing:
+            # Build the shared request once before fanning out, so the concurrent creates
+            # don't each parse a cold config and a broken one fails before any API call
             try:
-                # Create rich menu
-                rich_menu_id = await self.create_rich_menu_for_language(lang, menu_name)
+                await asyncio.to_thread(self._read_menu_request)
+            except Exception as e:
+                logger.error(f"Failed to load rich menu config: {e}")
+                return self.language_menus
 
-                if rich_menu_id:
-                    # Upload image
-                    success = await self.upload_rich_menu_image(rich_menu_id, str(image_path))
+        # Each language is an independent create + upload, so run them concurrently
+        created = await asyncio.gather(
+            *(self._setup_language_menu(lang, menu_name) for lang, menu_name in missing)
+        )
+        for (lang, _), rich_menu_id in zip(missing, created):
+            if rich_menu_id:
+                self.language_menus[lang] = rich_menu_id
 
-                    if success:
-                        self.language_menus[lang] = rich_menu_id
-                        logger.info(f"Created new rich menu for language {lang}: {rich_menu_id}")
-                    else:
-                        logger.error(f"Failed to upload image for language {lang}")
-                        await self.delete_rich_menu(rich_menu_id)
+        return self.language_menus
 
-            except Exception as e:
-                logger.error(f"Failed to create rich menu for language {lang}: {e}")
+    async def _setup_language_menu(self, lang: str, menu_name: str) -> Optional[str]:
+        image_path = self.rich_menu_dir / f"menu_{lang}.png"
 
-        return self.language_menus
+        if not image_path.exists():
+            logger.warning(f"Image not found for language {lang}: {image_path}")
+            return None
+
+        try:
+            # Create rich menu
+            rich_menu_id = await self.create_rich_menu_for_language(lang, menu_name)
+
+            if rich_menu_id:
+                # Upload image
+                success = await self.upload_rich_menu_image(rich_menu_id, str(image_path))
+
+                if success:
+                    logger.info(f"Created new rich menu for language {lang}: {rich_menu_id}")
+                    return rich_menu_id
+
+                logger.error(f"Failed to upload image for language {lang}")
+                await self.delete_rich_menu(rich_menu_id)
+
+        except Exception as e:
+            logger.error(f"Failed to create rich menu for language {lang}: {e}")
+
+        return None
 
     async def create_rich_menu_for_language(self, language: str, menu_name: str) -> Optional[str]:
         """
@@ -332,57 +426,20 @@ class RichMenuService:
             Rich menu ID if successful, None otherwise
         """
         try:
-            # Load config
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
-
-            # Create rich menu areas
-            areas = []
-            for area_config in config.get("areas", []):
-                bounds = area_config["bounds"]
-                action = area_config["action"]
-
-                # Create action based on type
-                if action["type"] == "postback":
-                    line_action = PostbackAction(
-                        data=action["data"],
-                        displayText=action.get("displayText"),
-                    )
-                else:
-                    logger.warning(f"Unsupported action type: {action['type']}")
-                    continue
-
-                # Create area
-                area = RichMenuArea(
-                    bounds=RichMenuBounds(
-                        x=bounds["x"],
-                        y=bounds["y"],
-                        width=bounds["width"],
-                        height=bounds["height"],
-                    ),
-                    action=line_action,
-                )
-                areas.append(area)
+            base_request = await asyncio.to_thread(self._read_menu_request)
 
             # Get language-specific chat bar text
             chat_bar_text = BotConfig.get_chat_bar_text(language)
 
-            # Create rich menu request with language-specific name and chatBarText
-            size_config = config["size"]
-            rich_menu_request = RichMenuRequest(
-                size=RichMenuSize(
-                    width=size_config["width"],
-                    height=size_config["height"],
-                ),
-                selected=config.get("selected", True),
-                name=menu_name,
-                chatBarText=chat_bar_text,  # Use language-specific text
-                areas=areas,
+            # Only the name and chatBarText differ per language; copy() skips re-validating the areas
+            rich_menu_request = base_request.copy(
+                update={"name": menu_name, "chat_bar_text": chat_bar_text}
             )
 
             # Create rich menu
             response = await self.line_api.create_rich_menu(rich_menu_request)
             rich_menu_id = response.rich_menu_id
+            self._menu_list_cache = None
 
             logger.info(f"Rich menu created for {language}: {rich_menu_id} with chatBarText: {chat_bar_text}")
             return rich_menu_id
@@ -432,12 +489,10 @@ class RichMenuService:
         try:
             menus = await self.get_rich_menu_list()
 
-            for menu in menus:
-                await self.delete_rich_menu(menu.rich_menu_id)
-                logger.info(f"Deleted rich menu: {menu.rich_menu_id}")
+            results = await self.delete_rich_menus([menu.rich_menu_id for menu in menus])
 
             self.language_menus.clear()
-            return True
+            return all(results)
 
         except Exception as e:
             logger.error(f"Failed to cleanup rich menus: {e}")
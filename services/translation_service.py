@@ -1,14 +1,23 @@
 """Translation service for group chat messages"""
+import hashlib
 import logging
 import os
+import re
+from typing import Optional
 
 from openai import AsyncOpenAI
 
+from cache import TTLCache
 from config import BotConfig
 from exceptions import ConfigurationError, TranslationError
 
 logger = logging.getLogger(__name__)
 
+_URL_ONLY_RE = re.compile(r"https?://\S+")
+
+# Translations don't go stale; the TTL only bounds how long idle entries linger
+TRANSLATION_CACHE_TTL = 3600
+
 
 class TranslationService:
     LANGUAGE_NAMES = {
@@ -29,9 +38,25 @@ class TranslationService:
         "fil": "🇵🇭",
     }
 
-    def __init__(self, config: BotConfig):
+    AUTO_PROMPT = (
+        "You are a professional translator. Translate the following text to {target}.\n"
+        "Only output the translated text, nothing else. Keep the tone and style natural."
+    )
+    PAIR_PROMPT = (
+        "You are a professional translator. Translate the following text from {source} to {target}.\n"
+        "Only output the translated text, nothing else. Keep the tone and style natural."
+    )
+
+    def __init__(self, config: BotConfig, client: Optional[AsyncOpenAI] = None):
         self.config = config
-        self.client = self._init_client()
+        # Sharing the AI service's client reuses its connection pool to the same backend
+        self._owns_client = client is None
+        self.client = client if client is not None else self._init_client()
+        # Group chats keep re-sending the same short phrases ("ok", "謝謝")
+        self._translation_cache: TTLCache[bytes, str] = TTLCache(
+            maxsize=2048, ttl=TRANSLATION_CACHE_TTL
+        )
+        self._prompts: dict[tuple[str, str], str] = {}
 
     def _init_client(self) -> AsyncOpenAI:
         try:
@@ -49,13 +74,15 @@ class TranslationService:
             raise TranslationError(f"Failed to initialize translation client: {e}") from e
 
     async def translate_message(self, text: str, target_language: str, source_language: str = "auto") -> str:
-        target_lang_name = self.LANGUAGE_NAMES.get(target_language, target_language.upper())
+        if source_language == target_language or not self._has_translatable_text(text):
+            return text
 
-        if source_language == "auto":
-            prompt = f"You are a professional translator. Translate the following text to {target_lang_name}.\nOnly output the translated text, nothing else. Keep the tone and style natural."
-        else:
-            source_lang_name = self.LANGUAGE_NAMES.get(source_language, source_language.upper())
-            prompt = f"You are a professional translator. Translate the following text from {source_lang_name} to {target_lang_name}.\nOnly output the translated text, nothing else. Keep the tone and style natural."
+        cache_key = self._translation_cache_key(text, target_language, source_language)
+        cached = self._translation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        prompt = self._system_prompt(source_language, target_language)
 
         try:
             response = await self.client.chat.completions.create(
@@ -65,8 +92,10 @@ class TranslationService:
                 max_tokens=500,
             )
 
+            translated = response.choices[0].message.content.strip()
+            self._translation_cache.set(cache_key, translated)
             logger.info(f"Translated text to {target_language}")
-            return response.choices[0].message.content.strip()
+            return translated
 
         except Exception as e:
             logger.error(f"Translation error: {e}")
@@ -77,7 +106,41 @@ class TranslationService:
         lang_name = self.LANGUAGE_NAMES.get(target_language, target_language.upper())
         return f"{flag} {lang_name}:\n{translated_text}"
 
+    @staticmethod
+    def _has_translatable_text(text: str) -> bool:
+        # Blank messages, bare links, and emoji/number/punctuation-only
+        # messages come back unchanged from the model anyway
+        stripped = text.strip()
+        if not stripped or _URL_ONLY_RE.fullmatch(stripped):
+            return False
+        return any(ch.isalpha() for ch in stripped)
+
+    def _system_prompt(self, source_language: str, target_language: str) -> str:
+        # Only a handful of language pairs occur, so each prompt is built once
+        prompt = self._prompts.get((source_language, target_language))
+        if prompt is None:
+            target = self.LANGUAGE_NAMES.get(target_language, target_language.upper())
+            if source_language == "auto":
+                prompt = self.AUTO_PROMPT.format(target=target)
+            else:
+                source = self.LANGUAGE_NAMES.get(source_language, source_language.upper())
+                prompt = self.PAIR_PROMPT.format(source=source, target=target)
+            # Codes arrive from the public API too; only memoize known ones
+            if target_language in self.LANGUAGE_NAMES and (
+                source_language == "auto" or source_language in self.LANGUAGE_NAMES
+            ):
+                self._prompts[(source_language, target_language)] = prompt
+        return prompt
+
+    @staticmethod
+    def _translation_cache_key(text: str, target_language: str, source_language: str) -> bytes:
+        return hashlib.blake2b(
+            f"{source_language}|{target_language}|{text}".encode(), digest_size=16
+        ).digest()
+
     async def aclose(self) -> None:
+        if not self._owns_client:
+            return
         try:
             await self.client.close()
             logger.info("Translation service client closed")
@@ -0,0 +1,112 @@
+"""Tests for AI service"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from config import BotConfig
+from exceptions import AIServiceError
+from services.ai_service import AIService
+
+
+def completion(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+HISTORY = [
+    {"role": "user", "content": "Which is cheaper, the first or the second?"},
+    {"role": "assistant", "content": "The second one is cheaper."},
+]
+
+
+class TestAIService:
+    """Test AIService class"""
+
+    @pytest.fixture
+    def db_service(self):
+        """Create a mock database service"""
+        db = AsyncMock()
+        db.get_conversation_history.return_value = []
+        return db
+
+    @pytest.fixture
+    async def ai_service(self, test_env, db_service, monkeypatch):
+        """Create an AI service with a mocked completion call"""
+        monkeypatch.setenv("RESPONSE_CACHE_TTL", "600")
+        service = AIService(db_service, BotConfig())
+        service._chat_create = AsyncMock(return_value=completion("Call 1955."))
+        yield service
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_opening_question_is_cached(self, ai_service):
+        """Test that the same first message from two users calls the LLM once"""
+        first = await ai_service.generate_response("user_a", "What is the labor hotline?", "en")
+        second = await ai_service.generate_response("user_b", "what is the  labor hotline?", "en")
+
+        assert first == second == "Call 1955."
+        ai_service._chat_create.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_different_question_misses_cache(self, ai_service):
+        """Test that a different message or language is not served from the cache"""
+        await ai_service.generate_response("user_a", "What is the labor hotline?", "en")
+        await ai_service.generate_response("user_b", "How do I renew my ARC?", "en")
+        await ai_service.generate_response("user_c", "What is the labor hotline?", "id")
+
+        assert ai_service._chat_create.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cache_skipped_when_history_exists(self, ai_service, db_service):
+        """Test that follow-ups are answered from the user's own conversation"""
+        await ai_service.generate_response("user_a", "yes", "en")
+
+        db_service.get_conversation_history.return_value = HISTORY
+        await ai_service.generate_response("user_b", "yes", "en")
+        await ai_service.generate_response("user_b", "yes", "en")
+
+        assert ai_service._chat_create.await_count == 3
+        messages = ai_service._chat_create.call_args.kwargs["messages"]
+        assert messages[1:3] == HISTORY
+
+    @pytest.mark.asyncio
+    async def test_reply_is_cleaned(self, ai_service):
+        """Test that reasoning blocks and markdown are stripped from the reply"""
+        ai_service._chat_create.return_value = completion(
+            "<think>the user wants the hotline</think>\n Call **1955** any time. "
+        )
+
+        reply = await ai_service._complete([], "en", "hotline?")
+
+        assert reply == "Call 1955 any time."
+        assert "stream" not in ai_service._chat_create.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_failed_completion_saves_nothing(self, ai_service, db_service):
+        """Test that an LLM error does not leave an unanswered user turn"""
+        ai_service._chat_create.side_effect = RuntimeError("LLM down")
+
+        with pytest.raises(AIServiceError):
+            await ai_service.generate_response("user_a", "hello", "en")
+
+        db_service.save_messages.assert_not_awaited()
+        db_service.save_message.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_reply_saves_both_turns(self, ai_service, db_service):
+        """Test that the user and assistant turns are saved together"""
+        await ai_service.generate_response("user_a", "hello", "en")
+
+        db_service.save_messages.assert_awaited_once_with(
+            "user_a", [("user", "hello"), ("assistant", "Call 1955.")]
+        )
+
+    @pytest.mark.asyncio
+    async def test_reply_survives_history_write_failure(self, ai_service, db_service):
+        """Test that a failed history write still returns the LLM reply"""
+        db_service.save_messages.side_effect = RuntimeError("database is locked")
+
+        reply = await ai_service.generate_response("user_a", "hello", "en")
+
+        assert reply == "Call 1955."
+        db_service.save_messages.assert_awaited_once()
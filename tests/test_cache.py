@@ -0,0 +1,47 @@
+"""Tests for in-process caching helpers"""
+from cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache class"""
+
+    def test_get_and_set(self):
+        """Test storing and retrieving a value"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert cache.get("missing", 0) == 0
+
+    def test_expired_entries_are_dropped(self, monkeypatch):
+        """Test that entries expire after the TTL"""
+        now = [100.0]
+        monkeypatch.setattr("cache.time.monotonic", lambda: now[0])
+
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        now[0] += 11
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        """Test LRU eviction once maxsize is exceeded"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_pop(self):
+        """Test removing an entry"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
@@ -1,6 +1,5 @@
 """Tests for configuration module"""
 import pytest
-import os
 from config import BotConfig, SUPPORTED_LANGUAGES, MESSAGES, load_config, get_config
 from exceptions import ConfigurationError
 
@@ -20,59 +19,67 @@ class TestBotConfig:
     def test_config_missing_line_credentials(self, monkeypatch):
         """Test that missing LINE credentials raises error"""
         monkeypatch.setattr("config.load_dotenv", lambda: None) # Mock load_dotenv
-        os.environ.pop("LINE_CHANNEL_SECRET", None)
-        os.environ.pop("LINE_CHANNEL_ACCESS_TOKEN", None)
+        monkeypatch.delenv("LINE_CHANNEL_SECRET", raising=False)
+        monkeypatch.delenv("LINE_CHANNEL_ACCESS_TOKEN", raising=False)
 
         with pytest.raises(ConfigurationError, match="LINE_CHANNEL_SECRET"):
             BotConfig()
 
-    def test_config_invalid_language(self, test_env):
+    def test_config_invalid_language(self, test_env, monkeypatch):
         """Test that invalid default language raises error"""
-        os.environ["DEFAULT_LANGUAGE"] = "invalid"
+        monkeypatch.setenv("DEFAULT_LANGUAGE", "invalid")
 
         with pytest.raises(ConfigurationError, match="Invalid DEFAULT_LANGUAGE"):
             BotConfig()
 
-    def test_config_cors_origins_parsing(self, test_env):
+    def test_config_cors_origins_parsing(self, test_env, monkeypatch):
         """Test CORS origins parsing"""
-        os.environ["CORS_ORIGINS"] = "http://localhost:3000,https://example.com"
+        monkeypatch.setenv("CORS_ORIGINS", "http://localhost:3000,https://example.com")
         config = BotConfig()
         assert len(config.cors_origins) == 2
         assert "http://localhost:3000" in config.cors_origins
         assert "https://example.com" in config.cors_origins
 
-    def test_config_cors_origins_default(self, test_env):
+    def test_config_cors_origins_default(self, test_env, monkeypatch):
         """Test default CORS origins"""
-        os.environ.pop("CORS_ORIGINS", None)
+        monkeypatch.delenv("CORS_ORIGINS", raising=False)
         config = BotConfig()
         assert "http://localhost:3000" in config.cors_origins
         assert "http://localhost:8000" in config.cors_origins
 
-    def test_config_invalid_cors_origin(self, test_env):
+    def test_config_invalid_cors_origin(self, test_env, monkeypatch):
         """Test that invalid CORS origin raises error"""
-        os.environ["CORS_ORIGINS"] = "invalid-url"
+        monkeypatch.setenv("CORS_ORIGINS", "invalid-url")
 
         with pytest.raises(ConfigurationError, match="Invalid CORS origin"):
             BotConfig()
 
-        # Cleanup
-        os.environ.pop("CORS_ORIGINS", None)
+    @pytest.mark.parametrize(
+        "key,value",
+        [
+            ("LLM_BATCH_WINDOW_MS", "five"),
+            ("LLM_BATCH_WINDOW_MS", "-1"),
+            ("LLM_MAX_BATCH", "0"),
+            ("LLM_MAX_BATCH", "8.5"),
+            ("RESPONSE_CACHE_TTL", "10m"),
+            ("RESPONSE_CACHE_TTL", "-600"),
+        ],
+    )
+    def test_config_invalid_integer(self, test_env, monkeypatch, key, value):
+        """Test that non-numeric or out-of-range integer settings raise error"""
+        monkeypatch.setenv(key, value)
+
+        with pytest.raises(ConfigurationError, match=f"Invalid {key}"):
+            BotConfig()
 
-    def test_get_message(self, test_env):
+    @pytest.mark.parametrize(
+        "lang,expected_substring", [(None, "IMIGO"), ("en", "Welcome"), ("zh", "歡迎")]
+    )
+    def test_get_message(self, test_env, lang, expected_substring):
         """Test getting localized messages"""
-        os.environ.pop("CORS_ORIGINS", None)  # Ensure clean state
         config = BotConfig()
 
-        # Test with default language
-        msg = config.get_message("welcome")
-        assert "IMIGO" in msg
-
-        # Test with specified language
-        msg_en = config.get_message("welcome", "en")
-        assert "Welcome" in msg_en
-
-        msg_zh = config.get_message("welcome", "zh")
-        assert "歡迎" in msg_zh
+        assert expected_substring in config.get_message("welcome", lang)
 
     def test_get_emergency_info(self, test_env):
         """Test emergency contact information"""
@@ -83,15 +90,15 @@ class TestBotConfig:
         assert "119" in info  # Ambulance
         assert "1955" in info  # Labor hotline
 
-    def test_is_valid_language(self, test_env):
+    @pytest.mark.parametrize(
+        "lang,valid",
+        [("id", True), ("en", True), ("zh", True), ("vi", True), ("invalid", False)],
+    )
+    def test_is_valid_language(self, test_env, lang, valid):
         """Test language validation"""
         config = BotConfig()
 
-        assert config.is_valid_language("id") is True
-        assert config.is_valid_language("en") is True
-        assert config.is_valid_language("zh") is True
-        assert config.is_valid_language("vi") is True
-        assert config.is_valid_language("invalid") is False
+        assert config.is_valid_language(lang) is valid
 
 
 class TestConfigManagement:
@@ -1,4 +1,7 @@
 """Tests for database service"""
+import asyncio
+from contextlib import asynccontextmanager
+
 import pytest
 from database.database import DatabaseService
 from datetime import datetime, timedelta
@@ -40,8 +43,9 @@ class TestDatabaseService:
         user_id = "test_user_456"
 
         # Save 15 messages
-        for i in range(15):
-            await db_service.save_message(user_id, "user", f"Message {i}")
+        await db_service.save_messages(
+            user_id, [("user", f"Message {i}") for i in range(15)]
+        )
 
         # Retrieve with limit of 10
         history = await db_service.get_conversation_history(user_id, limit=10)
@@ -89,6 +93,58 @@ class TestDatabaseService:
         lang = await db_service.get_user_language(user_id)
         assert lang == "zh"
 
+    @pytest.mark.asyncio
+    async def test_user_language_is_cached(self, db_service):
+        """Test that a repeated language lookup skips the database"""
+        user_id = "test_user_lang_cached"
+        await db_service.set_user_language(user_id, "vi")
+        db_service._language_cache.clear()
+
+        assert await db_service.get_user_language(user_id) == "vi"
+
+        def no_session():
+            raise AssertionError("cached lookup should not open a session")
+
+        db_service.Session = no_session
+        assert await db_service.get_user_language(user_id) == "vi"
+
+    @pytest.mark.asyncio
+    async def test_racing_read_does_not_recache_old_language(self, db_service):
+        """Test that a read started before a language change cannot cache the old value"""
+        user_id = "test_user_lang_race"
+        await db_service.set_user_language(user_id, "en")
+        db_service._language_cache.clear()
+
+        real_session = db_service.Session
+        read_done = asyncio.Event()
+        release = asyncio.Event()
+
+        @asynccontextmanager
+        async def paused_session():
+            # Hold the lookup after it has read the row, before it can cache it
+            async with real_session() as s:
+                real_scalar = s.scalar
+
+                async def scalar(*args, **kwargs):
+                    result = await real_scalar(*args, **kwargs)
+                    read_done.set()
+                    await release.wait()
+                    return result
+
+                s.scalar = scalar
+                yield s
+
+        db_service.Session = paused_session
+        stale_read = asyncio.create_task(db_service.get_user_language(user_id))
+        await read_done.wait()
+
+        db_service.Session = real_session
+        await db_service.set_user_language(user_id, "zh")
+        release.set()
+
+        assert await stale_read == "en"
+        assert await db_service.get_user_language(user_id) == "zh"
+
     @pytest.mark.asyncio
     async def test_group_translation_settings(self, db_service):
         """Test group translation settings"""
@@ -116,6 +172,20 @@ class TestDatabaseService:
         settings = await db_service.get_group_settings(group_id)
         assert settings["translate_enabled"] is False
 
+    @pytest.mark.asyncio
+    async def test_group_settings_are_cached(self, db_service):
+        """Test that repeated group settings lookups skip the database"""
+        group_id = "test_group_cached"
+        await db_service.enable_group_translation(group_id, "id", "test_user_admin")
+        settings = await db_service.get_group_settings(group_id)
+
+        # Mutating the returned dict must not leak into the cache
+        settings["target_language"] = "en"
+        await db_service.dispose()
+
+        cached = await db_service.get_group_settings(group_id)
+        assert cached["target_language"] == "id"
+
     @pytest.mark.asyncio
     async def test_cleanup_old_conversations(self, db_service):
         """Test cleaning up old conversations"""
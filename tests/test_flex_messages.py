@@ -0,0 +1,56 @@
+"""Tests for Flex Message templates"""
+import pytest
+from linebot.v3.messaging import FlexContainer
+
+from config import SUPPORTED_LANGUAGES
+from services.flex_messages import (
+    create_category_carousel,
+    create_emergency_flex_message,
+    create_help_flex_message,
+    create_new_user_welcome_flex,
+    create_welcome_flex_message,
+)
+
+BUILDERS = [
+    create_welcome_flex_message,
+    create_help_flex_message,
+    create_emergency_flex_message,
+    create_category_carousel,
+]
+
+
+class TestFlexMessages:
+    """Test prebuilt Flex Message templates"""
+
+    @pytest.mark.parametrize("builder", BUILDERS)
+    def test_same_language_returns_cached_message(self, builder):
+        """Test that repeated calls share one structure"""
+        assert builder("zh") is builder("zh")
+        assert builder("zh") is not builder("en")
+
+    @pytest.mark.parametrize("builder", BUILDERS)
+    def test_unknown_language_falls_back_to_english(self, builder):
+        """Test that unsupported codes get the English message"""
+        assert builder("xx") is builder("en")
+
+    @pytest.mark.parametrize("builder", BUILDERS)
+    def test_every_supported_language_is_prebuilt(self, builder):
+        """Test that each supported language has its own message"""
+        messages = [builder(lang) for lang in SUPPORTED_LANGUAGES]
+        assert len({id(message) for message in messages}) == len(SUPPORTED_LANGUAGES)
+
+    @pytest.mark.parametrize("builder", BUILDERS)
+    @pytest.mark.parametrize("language", list(SUPPORTED_LANGUAGES))
+    def test_templates_survive_sdk_parsing(self, builder, language):
+        """Test that the LINE SDK keeps every field of the shared templates"""
+        message = builder(language)
+        assert FlexContainer.from_dict(message).to_dict() == message
+
+    def test_new_user_template_is_shared(self):
+        """Test that the new user template is built once"""
+        assert create_new_user_welcome_flex() is create_new_user_welcome_flex()
+
+    def test_new_user_template_survives_sdk_parsing(self):
+        """Test that the LINE SDK keeps every field of the new user template"""
+        message = create_new_user_welcome_flex()
+        assert FlexContainer.from_dict(message).to_dict() == message
@@ -0,0 +1,65 @@
+"""Tests for language detection service"""
+from services import language_detection
+from services.language_detection import LanguageDetectionService
+
+
+class TestLanguageDetectionService:
+    """Test LanguageDetectionService class"""
+
+    def test_detects_supported_language(self):
+        """Test that a clear sentence maps to a supported code"""
+        service = LanguageDetectionService(default_language="en")
+
+        assert service.detect_language("Saya ingin bertanya tentang gaji saya bulan ini") == "id"
+
+    def test_empty_and_short_ascii_use_default(self):
+        """Test that empty or tiny ASCII input falls back to the default"""
+        service = LanguageDetectionService(default_language="id")
+
+        assert service.detect_language("") == "id"
+        assert service.detect_language("   ") == "id"
+        assert service.detect_language("ok") == "id"
+
+    def test_dominant_script_skips_langdetect(self, monkeypatch):
+        """Test that Han, Thai and Vietnamese text is classified by script"""
+        def fail_detect(text):
+            raise AssertionError("langdetect should not run")
+
+        language_detection._detect_cached.cache_clear()
+        monkeypatch.setattr(language_detection, "detect", fail_detect)
+        service = LanguageDetectionService()
+
+        assert service.detect_language("你好") == "zh"
+        assert service.detect_language("สวัสดีครับ") == "th"
+        assert service.detect_language("Tôi muốn hỏi về lương") == "vi"
+        language_detection._detect_cached.cache_clear()
+
+    def test_repeated_text_is_cached(self, monkeypatch):
+        """Test that repeated messages reuse the cached detection"""
+        calls = []
+
+        def fake_detect(text):
+            calls.append(text)
+            return "en"
+
+        language_detection._detect_cached.cache_clear()
+        monkeypatch.setattr(language_detection, "detect", fake_detect)
+        service = LanguageDetectionService()
+
+        assert service.detect_language("thank you very much") == "en"
+        assert service.detect_language("  thank you very much ") == "en"
+        assert calls == ["thank you very much"]
+        language_detection._detect_cached.cache_clear()
+
+    def test_vietnamese_name_does_not_switch_language(self):
+        """Test that a Vietnamese name inside English or Indonesian is not read as Vietnamese"""
+        language_detection._detect_cached.cache_clear()
+        service = LanguageDetectionService(default_language="zh")
+        english = "Please tell my boss Nguyễn that I am sick today and cannot come to work"
+        indonesian = "Saya mau ketemu Pak Trần Văn Đức besok di kantor untuk tanda tangan kontrak"
+
+        assert language_detection._script_hint(english) is None
+        assert language_detection._script_hint(indonesian) is None
+        assert service.detect_language(english) == "en"
+        assert service.detect_language(indonesian) == "id"
+        language_detection._detect_cached.cache_clear()
@@ -0,0 +1,70 @@
+"""Tests for LLM request batcher"""
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.llm_batcher import LLMBatcher
+
+
+class TestLLMBatcher:
+    """Test LLMBatcher class"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_a_batch(self):
+        """Test that requests arriving in one window are dispatched together"""
+        calls = []
+
+        async def create(**kwargs):
+            calls.append(kwargs["n"])
+            await asyncio.sleep(0)
+            return kwargs["n"] * 2
+
+        batcher = LLMBatcher(create, window_ms=20, max_batch=8)
+        results = await asyncio.gather(*(batcher.submit(n=i) for i in range(5)))
+        await batcher.aclose()
+
+        assert results == [0, 2, 4, 6, 8]
+        assert sorted(calls) == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_exception_is_returned_to_caller(self):
+        """Test that a failing request only fails its own caller"""
+
+        async def create(**kwargs):
+            if kwargs["n"] == 1:
+                raise RuntimeError("LLM down")
+            return kwargs["n"]
+
+        batcher = LLMBatcher(create, window_ms=5)
+        results = await asyncio.gather(
+            batcher.submit(n=0), batcher.submit(n=1), return_exceptions=True
+        )
+        await batcher.aclose()
+
+        assert results[0] == 0
+        assert isinstance(results[1], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_result_for_cancelled_caller_is_closed(self):
+        """Test that a stream nobody is waiting for is closed instead of leaked"""
+        started = asyncio.Event()
+        release = asyncio.Event()
+        stream = AsyncMock()
+
+        async def create(**kwargs):
+            started.set()
+            await release.wait()
+            return stream
+
+        batcher = LLMBatcher(create, window_ms=1)
+        caller = asyncio.create_task(batcher.submit(stream=True))
+        await started.wait()
+        caller.cancel()
+        await asyncio.gather(caller, return_exceptions=True)
+
+        release.set()
+        await asyncio.gather(*batcher._inflight)
+        await batcher.aclose()
+
+        stream.close.assert_awaited_once()
@@ -1,10 +1,17 @@
 """Tests for rich menu service"""
+import asyncio
+import os
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections import namedtuple
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 from pathlib import Path
+from services import rich_menu_service as rich_menu_module
 from services.rich_menu_service import RichMenuService
 from exceptions import RichMenuError, ValidationError
 
+_RM = namedtuple("RM", "rich_menu_id name")
+
 
 class TestRichMenuService:
     """Test RichMenuService class"""
@@ -24,6 +31,15 @@ class TestRichMenuService:
         """Create a rich menu service with mock API"""
         return RichMenuService(mock_line_api, mock_blob_api)
 
+    @pytest.fixture(scope="session")
+    def stub_rich_menu_dir(self, tmp_path_factory):
+        """Create stub menu images once for every test that uploads them"""
+        stub_dir = tmp_path_factory.mktemp("rich_menu")
+        for lang in ("en", "id", "vi", "zh"):
+            (stub_dir / f"menu_{lang}.png").write_bytes(f"{lang}_img".encode())
+        (stub_dir / "test_image.png").write_bytes(b"test_image_content")
+        return stub_dir
+
     def test_initialization(self, rich_menu_service):
         """Test service initialization"""
         assert rich_menu_service.line_api is not None
@@ -65,6 +81,19 @@ class TestRichMenuService:
         with pytest.raises(ValueError, match="Invalid image format"):
             rich_menu_service._validate_image_path(str(test_file))
 
+    def test_menu_config_parsed_once(self, rich_menu_service, tmp_path):
+        """Test that the config is reused until the file changes"""
+        config_path = tmp_path / "menu_config.json"
+        config_path.write_text('{"name": "A"}', encoding="utf-8")
+        rich_menu_service.config_path = config_path
+
+        first = rich_menu_service._read_menu_config()
+        assert rich_menu_service._read_menu_config() is first
+
+        config_path.write_text('{"name": "B"}', encoding="utf-8")
+        os.utime(config_path, (1, 1))
+        assert rich_menu_service._read_menu_config() == {"name": "B"}
+
     def test_get_rich_menu_for_language(self, rich_menu_service):
         """Test getting rich menu for a language"""
         rich_menu_service.language_menus = {"en": "menu_123", "id": "menu_456"}
@@ -140,11 +169,9 @@ class TestRichMenuService:
     @pytest.mark.asyncio
     async def test_get_rich_menu_list(self, rich_menu_service, mock_line_api):
         """Test getting rich menu list"""
-        mock_response = MagicMock()
-        mock_response.richmenus = [
-            MagicMock(rich_menu_id="menu_1", name="Menu 1"),
-            MagicMock(rich_menu_id="menu_2", name="Menu 2"),
-        ]
+        mock_response = SimpleNamespace(
+            richmenus=[_RM("menu_1", "Menu 1"), _RM("menu_2", "Menu 2")]
+        )
         mock_line_api.get_rich_menu_list = AsyncMock(return_value=mock_response)
 
         menus = await rich_menu_service.get_rich_menu_list()
@@ -153,6 +180,35 @@ class TestRichMenuService:
         assert menus[0].rich_menu_id == "menu_1"
         assert menus[1].rich_menu_id == "menu_2"
 
+    @pytest.mark.asyncio
+    async def test_get_rich_menu_list_is_cached_until_delete(self, rich_menu_service, mock_line_api):
+        """Test that back-to-back listings share one API call until a menu is deleted"""
+        mock_line_api.get_rich_menu_list = AsyncMock(return_value=SimpleNamespace(richmenus=[]))
+
+        await rich_menu_service.get_rich_menu_list()
+        await rich_menu_service.get_rich_menu_list()
+        assert mock_line_api.get_rich_menu_list.await_count == 1
+
+        await rich_menu_service.delete_rich_menu("menu_1")
+        await rich_menu_service.get_rich_menu_list()
+        assert mock_line_api.get_rich_menu_list.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_rich_menu_list_can_bypass_cache(self, rich_menu_service, mock_line_api):
+        """Test that use_cache=False always asks the API and refreshes the cache"""
+        mock_line_api.get_rich_menu_list = AsyncMock(return_value=SimpleNamespace(richmenus=[]))
+        await rich_menu_service.get_rich_menu_list()
+
+        mock_line_api.get_rich_menu_list.return_value = SimpleNamespace(
+            richmenus=[_RM("menu_1", "Menu 1")]
+        )
+        fresh = await rich_menu_service.get_rich_menu_list(use_cache=False)
+        cached = await rich_menu_service.get_rich_menu_list()
+
+        assert [m.rich_menu_id for m in fresh] == ["menu_1"]
+        assert cached == fresh
+        assert mock_line_api.get_rich_menu_list.await_count == 2
+
     @pytest.mark.asyncio
     async def test_delete_rich_menu(self, rich_menu_service, mock_line_api):
         """Test deleting a rich menu"""
@@ -166,15 +222,14 @@ class TestRichMenuService:
         mock_line_api.delete_rich_menu.assert_called_once_with(rich_menu_id)
 
     @pytest.mark.asyncio
-    async def test_upload_rich_menu_image_success(self, rich_menu_service, mock_blob_api, tmp_path, monkeypatch):
+    async def test_upload_rich_menu_image_success(self, rich_menu_service, mock_blob_api, stub_rich_menu_dir, monkeypatch):
         """Test successful image upload for rich menu"""
         rich_menu_id = "test_rich_menu_id"
         
-        # Mock rich_menu_service.rich_menu_dir to point to tmp_path
-        monkeypatch.setattr(rich_menu_service, 'rich_menu_dir', tmp_path)
+        # Mock rich_menu_service.rich_menu_dir to point to the stub images
+        monkeypatch.setattr(rich_menu_service, 'rich_menu_dir', stub_rich_menu_dir)
         
-        image_path = tmp_path / "test_image.png"
-        image_path.write_bytes(b"test_image_content")
+        image_path = stub_rich_menu_dir / "test_image.png"
 
         mock_blob_api.set_rich_menu_image = AsyncMock(return_value=None)
 
@@ -188,15 +243,14 @@ class TestRichMenuService:
         assert kwargs["_headers"]["Content-Type"] == "image/png"
 
     @pytest.mark.asyncio
-    async def test_upload_rich_menu_image_failure(self, rich_menu_service, mock_blob_api, tmp_path, monkeypatch):
+    async def test_upload_rich_menu_image_failure(self, rich_menu_service, mock_blob_api, stub_rich_menu_dir, monkeypatch):
         """Test image upload failure for rich menu"""
         rich_menu_id = "test_rich_menu_id"
         
-        # Mock rich_menu_service.rich_menu_dir to point to tmp_path
-        monkeypatch.setattr(rich_menu_service, 'rich_menu_dir', tmp_path)
+        # Mock rich_menu_service.rich_menu_dir to point to the stub images
+        monkeypatch.setattr(rich_menu_service, 'rich_menu_dir', stub_rich_menu_dir)
         
-        image_path = tmp_path / "test_image.png"
-        image_path.write_bytes(b"test_image_content")
+        image_path = stub_rich_menu_dir / "test_image.png"
 
         mock_blob_api.set_rich_menu_image = AsyncMock(side_effect=Exception("Upload error"))
 
@@ -213,8 +267,7 @@ class TestRichMenuService:
         mock_rich_menu_id = "richmenu-test-en"
 
         # Mock the create_rich_menu response
-        mock_response = MagicMock()
-        mock_response.rich_menu_id = mock_rich_menu_id
+        mock_response = SimpleNamespace(rich_menu_id=mock_rich_menu_id)
         mock_line_api.create_rich_menu.return_value = mock_response
 
         # Ensure the config file exists for the test
@@ -229,25 +282,17 @@ class TestRichMenuService:
         assert args[0].name == menu_name
         
     @pytest.mark.asyncio
-    async def test_create_language_rich_menus_success(self, rich_menu_service, mock_line_api, mock_blob_api, project_root, tmp_path):
+    async def test_create_language_rich_menus_success(self, rich_menu_service, mock_line_api, mock_blob_api, project_root, stub_rich_menu_dir):
         """Test successful creation of rich menus for all languages"""
-        # Create dummy image files for the test
-        rich_menu_service.rich_menu_dir = tmp_path
-        (tmp_path / "menu_en.png").write_bytes(b"en_img")
-        (tmp_path / "menu_id.png").write_bytes(b"id_img")
-        (tmp_path / "menu_vi.png").write_bytes(b"vi_img")
-        (tmp_path / "menu_zh.png").write_bytes(b"zh_img")
+        # Point the service at the stub image files
+        rich_menu_service.rich_menu_dir = stub_rich_menu_dir
 
         # Mock existing menus to be empty initially
-        mock_line_api.get_rich_menu_list.return_value = MagicMock(richmenus=[])
+        mock_line_api.get_rich_menu_list.return_value = SimpleNamespace(richmenus=[])
 
-        # Mock create_rich_menu to return distinct rich_menu_ids
-        mock_line_api.create_rich_menu.side_effect = [
-            MagicMock(rich_menu_id="richmenu-en"),
-            MagicMock(rich_menu_id="richmenu-id"),
-            MagicMock(rich_menu_id="richmenu-vi"),
-            MagicMock(rich_menu_id="richmenu-zh"),
-        ]
+        # Menus are created concurrently, so derive each id from the menu name
+        menu_ids = {name: f"richmenu-{lang}" for lang, name in rich_menu_service.LANGUAGE_NAMES.items()}
+        mock_line_api.create_rich_menu.side_effect = lambda request: SimpleNamespace(rich_menu_id=menu_ids[request.name])
 
         # Mock set_rich_menu_image to always succeed
         mock_blob_api.set_rich_menu_image.return_value = None
@@ -268,3 +313,37 @@ class TestRichMenuService:
         assert mock_blob_api.set_rich_menu_image.call_count == 4
         
 
+    @pytest.mark.asyncio
+    async def test_cleanup_all_rich_menus(self, rich_menu_service, mock_line_api):
+        """Test that every menu is deleted and a failure is reported"""
+        mock_line_api.get_rich_menu_list.return_value = SimpleNamespace(
+            richmenus=[_RM("menu_1", "Menu 1"), _RM("menu_2", "Menu 2")]
+        )
+        mock_line_api.delete_rich_menu.side_effect = [None, Exception("API error")]
+        rich_menu_service.language_menus = {"en": "menu_1"}
+
+        result = await rich_menu_service.cleanup_all_rich_menus()
+
+        assert result is False
+        assert mock_line_api.delete_rich_menu.call_count == 2
+        assert rich_menu_service.language_menus == {}
+
+    @pytest.mark.asyncio
+    async def test_delete_rich_menus_is_bounded(self, rich_menu_service, mock_line_api, monkeypatch):
+        """Test that bulk deletes never exceed the concurrency cap"""
+        monkeypatch.setattr(rich_menu_module, "MAX_CONCURRENT_DELETES", 3)
+        active = peak = 0
+
+        async def delete(rich_menu_id):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+
+        mock_line_api.delete_rich_menu.side_effect = delete
+
+        results = await rich_menu_service.delete_rich_menus([f"menu_{i}" for i in range(20)])
+
+        assert results == [True] * 20
+        assert peak == 3
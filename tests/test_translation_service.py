@@ -0,0 +1,71 @@
+"""Tests for translation service"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from config import BotConfig
+from services.translation_service import TranslationService
+
+
+def completion(content: str) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class TestTranslationService:
+    """Test TranslationService class"""
+
+    @pytest.fixture
+    def translation_service(self, test_env):
+        """Create a translation service with a mocked LLM client"""
+        service = TranslationService(BotConfig())
+        service.client = AsyncMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_repeated_translation_is_cached(self, translation_service):
+        """Test that an identical request is served without a second LLM call"""
+        create = translation_service.client.chat.completions.create
+        create.return_value = completion(" 謝謝 ")
+
+        first = await translation_service.translate_message("thank you", "zh")
+        second = await translation_service.translate_message("thank you", "zh")
+
+        assert first == second == "謝謝"
+        create.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_key_includes_languages(self, translation_service):
+        """Test that different target languages are translated separately"""
+        create = translation_service.client.chat.completions.create
+        create.side_effect = [completion("謝謝"), completion("Terima kasih")]
+
+        assert await translation_service.translate_message("thank you", "zh") == "謝謝"
+        assert await translation_service.translate_message("thank you", "id") == "Terima kasih"
+        assert create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_same_source_and_target_skips_llm(self, translation_service):
+        """Test that text already in the target language is returned as is"""
+        result = await translation_service.translate_message("selamat pagi", "id", source_language="id")
+
+        assert result == "selamat pagi"
+        translation_service.client.chat.completions.create.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text", ["", "   ", "https://example.com/a?b=1", "👍", "123!!"])
+    async def test_untranslatable_text_skips_llm(self, translation_service, text):
+        """Test that blank, link-only and symbol-only messages are returned as is"""
+        assert await translation_service.translate_message(text, "zh") == text
+        translation_service.client.chat.completions.create.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_shared_client_is_not_closed(self, test_env):
+        """Test that a client passed in by the caller stays open on aclose"""
+        client = AsyncMock()
+        service = TranslationService(BotConfig(), client=client)
+
+        await service.aclose()
+
+        assert service.client is client
+        client.close.assert_not_awaited()
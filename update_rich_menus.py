@@ -1,6 +1,7 @@
 import asyncio
 import argparse
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List
 
@@ -11,6 +12,7 @@ from dependencies import (
     initialize_services,
     cleanup_services,
 )
+from services.rich_menu_service import RICH_MENU_DIR
 
 logging.basicConfig(
     level=logging.INFO,
@@ -67,14 +69,17 @@ class RichMenuUpdater:
 
         logger.info(f"Found {len(menus)} menu(s) to delete")
 
+        results = await self.rich_menu_service.delete_rich_menus(
+            [menu.rich_menu_id for menu in menus]
+        )
+
         success_count = 0
-        for menu in menus:
-            try:
-                await self.rich_menu_service.delete_rich_menu(menu.rich_menu_id)
+        for menu, deleted in zip(menus, results):
+            if deleted:
                 logger.info(f"✓ Deleted: {menu.name} ({menu.rich_menu_id})")
                 success_count += 1
-            except Exception as e:
-                logger.error(f"✗ Failed to delete {menu.name}: {e}")
+            else:
+                logger.error(f"✗ Failed to delete {menu.name}")
 
         self.rich_menu_service.language_menus.clear()
 
@@ -87,27 +92,29 @@ class RichMenuUpdater:
         logger.info("Verifying image files")
         logger.info("=" * 60)
 
-        rich_menu_dir = Path(__file__).parent / "rich_menu"
         languages = self.rich_menu_service.SUPPORTED_LANGUAGES
 
         image_files = {}
         missing_files = []
 
         for lang in languages:
-            image_path = rich_menu_dir / f"menu_{lang}.png"
+            image_path = RICH_MENU_DIR / f"menu_{lang}.png"
 
-            if image_path.exists():
-                # Check file size
-                size_mb = image_path.stat().st_size / (1024 * 1024)
-                logger.info(f"✓ Found {image_path.name} ({size_mb:.2f} MB)")
-
-                if size_mb > 1.0:
-                    logger.warning(f"  ⚠ Warning: File size exceeds 1 MB LINE limit")
-
-                image_files[lang] = image_path
-            else:
+            # One stat both checks existence and gives the size
+            try:
+                st = os.stat(image_path)
+            except OSError:
                 logger.error(f"✗ Missing: {image_path.name}")
                 missing_files.append(image_path.name)
+                continue
+
+            size_mb = st.st_size / (1024 * 1024)
+            logger.info(f"✓ Found {image_path.name} ({size_mb:.2f} MB)")
+
+            if size_mb > 1.0:
+                logger.warning(f"  ⚠ Warning: File size exceeds 1 MB LINE limit")
+
+            image_files[lang] = image_path
 
         if missing_files:
             logger.error(f"\nMissing {len(missing_files)} image file(s):")
@@ -166,11 +173,12 @@ class RichMenuUpdater:
                 logger.warning("Use --force to recreate them, or --skip-cleanup to keep existing ones")
                 return False
 
-            # Verify images first
-            image_files = await self.verify_image_files()
-            if not image_files and not cleanup_only:
-                logger.error("Cannot proceed without required image files")
-                return False
+            # Verify images before deleting anything; cleanup-only never uploads them
+            if not cleanup_only:
+                image_files = await self.verify_image_files()
+                if not image_files:
+                    logger.error("Cannot proceed without required image files")
+                    return False
 
             # Step 1: Cleanup
             if not skip_cleanup:
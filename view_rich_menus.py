@@ -19,6 +19,39 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _render_postback(action) -> list:
+    lines = [f"        Action: postback → {action.data}"]
+    if action.display_text:
+        lines.append(f"        Display: {action.display_text}")
+    return lines
+
+
+def _render_uri(action) -> list:
+    return [f"        Action: uri → {action.uri}"]
+
+
+def _render_message(action) -> list:
+    return [f"        Action: message → {action.text}"]
+
+
+def _render_other(action) -> list:
+    # richmenuswitch, datetimepicker and any newer types: show whatever they carry
+    lines = [f"        Action: {action.type}"]
+    for field in ("data", "uri", "text"):
+        value = getattr(action, field, None)
+        if value:
+            lines.append(f"        {field.capitalize()}: {value}")
+    return lines
+
+
+# Keyed on the action's "type" discriminator
+ACTION_RENDERERS = {
+    "postback": _render_postback,
+    "uri": _render_uri,
+    "message": _render_message,
+}
+
+
 async def view_menus(show_details: bool = False, export: bool = False):
     """View all rich menus"""
     try:
@@ -30,8 +63,11 @@ async def view_menus(show_details: bool = False, export: bool = False):
         logger.info("RICH MENU STATUS")
         logger.info("=" * 70)
 
-        # Get all menus
-        menus = await rich_menu_service.get_rich_menu_list()
+        # The menu list and the default menu are independent lookups
+        menus, default_menu_id = await asyncio.gather(
+            rich_menu_service.get_rich_menu_list(),
+            rich_menu_service.get_default_rich_menu_id(),
+        )
 
         if not menus:
             logger.info("\n⚠ No rich menus found")
@@ -41,8 +77,6 @@ async def view_menus(show_details: bool = False, export: bool = False):
 
         logger.info(f"\nTotal Menus: {len(menus)}")
 
-        # Get default menu
-        default_menu_id = await rich_menu_service.get_default_rich_menu_id()
         if default_menu_id:
             logger.info(f"Default Menu: {default_menu_id}")
         else:
@@ -71,30 +105,29 @@ async def view_menus(show_details: bool = False, export: bool = False):
         for i, menu in enumerate(menus, 1):
             is_default = menu.rich_menu_id == default_menu_id
 
-            logger.info(f"\n{i}. {menu.name}")
-            logger.info(f"   ID: {menu.rich_menu_id}")
-            logger.info(f"   Chat Bar Text: {menu.chat_bar_text}")
-            logger.info(f"   Selected: {menu.selected}")
-            logger.info(f"   Default: {'Yes ⭐' if is_default else 'No'}")
-            logger.info(f"   Size: {menu.size.width}x{menu.size.height}")
-            logger.info(f"   Areas: {len(menu.areas)} clickable region(s)")
+            # One log call per menu instead of one per line
+            lines = [
+                f"\n{i}. {menu.name}",
+                f"   ID: {menu.rich_menu_id}",
+                f"   Chat Bar Text: {menu.chat_bar_text}",
+                f"   Selected: {menu.selected}",
+                f"   Default: {'Yes ⭐' if is_default else 'No'}",
+                f"   Size: {menu.size.width}x{menu.size.height}",
+                f"   Areas: {len(menu.areas)} clickable region(s)",
+            ]
 
             if show_details:
-                logger.info(f"\n   Clickable Areas:")
+                lines.append(f"\n   Clickable Areas:")
                 for j, area in enumerate(menu.areas, 1):
                     bounds = area.bounds
                     action = area.action
 
-                    logger.info(f"     {j}. Position: ({bounds.x}, {bounds.y}, {bounds.width}, {bounds.height})")
+                    lines.append(f"     {j}. Position: ({bounds.x}, {bounds.y}, {bounds.width}, {bounds.height})")
+
+                    render = ACTION_RENDERERS.get(action.type, _render_other)
+                    lines.extend(render(action))
 
-                    if hasattr(action, 'data'):
-                        logger.info(f"        Action: postback → {action.data}")
-                        if hasattr(action, 'display_text') and action.display_text:
-                            logger.info(f"        Display: {action.display_text}")
-                    elif hasattr(action, 'uri'):
-                        logger.info(f"        Action: uri → {action.uri}")
-                    elif hasattr(action, 'text'):
-                        logger.info(f"        Action: message → {action.text}")
+            logger.info("\n".join(lines))
 
             if export:
                 export_data.append({
@@ -112,12 +145,13 @@ async def view_menus(show_details: bool = False, export: bool = False):
 
         # Export to file if requested
         if export:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             export_file = Path(f"rich_menu_export_{timestamp}.json")
 
             with open(export_file, 'w', encoding='utf-8') as f:
                 json.dump({
-                    'exported_at': datetime.now().isoformat(),
+                    'exported_at': now.isoformat(),
                     'total_menus': len(menus),
                     'default_menu_id': default_menu_id,
                     'menus': export_data